@@ -0,0 +1,136 @@
+"""
+Resolución por lotes de integrales desde la línea de comandos.
+
+Lee un archivo JSONL (un objeto {"f": ..., "a": ..., "b": ...} por línea) o
+CSV (con columnas f, a, b) y reparte las integrales entre procesos
+trabajadores. Cada resultado se escribe como una línea JSON en cuanto
+termina, por lo que el uso de memoria no depende del tamaño del archivo:
+
+	python batch.py ejercicios.jsonl -o resultados.jsonl --workers 8
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from solver import InvalidInputError, IntegralResult, SOLVE_TIMEOUT, parse_integral, solve_isolated
+from workers import SolverPool
+
+
+class RowError(ValueError):
+	"""Fila que no se pudo leer; se escribe como registro de error en lugar de resolverla."""
+
+
+def read_rows(path):
+	"""
+	Genera (número de fila, dict con f, a, b y opcionalmente id) sin cargar el
+	archivo entero. Una línea JSONL que no es un objeto JSON válido se genera
+	como RowError, para que no detenga el resto del lote.
+	"""
+	with open(path, newline="", encoding="utf-8") as handle:
+		if path.lower().endswith(".csv"):
+			for number, row in enumerate(csv.DictReader(handle), start=1):
+				yield number, row
+		else:
+			for number, line in enumerate(handle, start=1):
+				line = line.strip()
+				if not line:
+					continue
+				try:
+					row = json.loads(line)
+				except json.JSONDecodeError as e:
+					row = RowError(f"JSON inválido: {e}")
+				if not isinstance(row, (dict, RowError)):
+					row = RowError("se esperaba un objeto JSON con f, a y b")
+				yield number, row
+
+
+def error_record(number, error):
+	"""Línea de salida de una fila que no se pudo leer o resolver."""
+	message = str(error) if isinstance(error, RowError) else f"{type(error).__name__}: {error}"
+	return {"row": number, "status": "error", "error": message}
+
+
+def solve_row(pool, number, row, timeout):
+	"""
+	Resuelve una fila en el pool y devuelve su línea de salida como dict. Un
+	error al resolverla (p. ej. un resultado que no se puede devolver desde el
+	trabajador) se devuelve como registro de error.
+	"""
+	start = time.perf_counter()
+	f_str, a_str, b_str = str(row.get("f", "")), str(row.get("a", "")), str(row.get("b", ""))
+	try:
+		f, a, b = parse_integral(f_str, a_str, b_str)
+		result = solve_isolated(f, a, b, pool=pool, timeout=timeout)
+	except InvalidInputError as e:
+		result = IntegralResult(status="invalid_input", message=str(e))
+	except Exception as e:
+		return error_record(number, e)
+	record = {"row": number, "id": row.get("id"), "f": f_str, "a": a_str, "b": b_str}
+	record.update(result.summary())
+	record["seconds"] = round(time.perf_counter() - start, 4)
+	return record
+
+
+def run_batch(rows, out, workers, timeout):
+	"""
+	Resuelve `rows` con `workers` procesos y escribe cada resultado en `out`
+	al terminar. Como mucho hay 2 * workers filas en curso a la vez.
+	"""
+	pool = SolverPool(size=workers)
+	pending, numbers = set(), {}
+	try:
+		with ThreadPoolExecutor(max_workers=workers) as executor:
+			for number, row in rows:
+				if isinstance(row, RowError):
+					_write_record(out, error_record(number, row))
+					continue
+				if len(pending) >= 2 * workers:
+					done, pending = wait(pending, return_when=FIRST_COMPLETED)
+					_write(out, done, numbers)
+				future = executor.submit(solve_row, pool, number, row, timeout)
+				numbers[future] = number
+				pending.add(future)
+			while pending:
+				done, pending = wait(pending, return_when=FIRST_COMPLETED)
+				_write(out, done, numbers)
+	finally:
+		pool.shutdown()
+
+
+def _write(out, futures, numbers):
+	for future in futures:
+		number = numbers.pop(future)
+		try:
+			record = future.result()
+		except Exception as e:
+			record = error_record(number, e)
+		_write_record(out, record)
+
+
+def _write_record(out, record):
+	out.write(json.dumps(record, ensure_ascii=False) + "\n")
+	out.flush()
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="Resuelve por lotes integrales (f, a, b) de un archivo JSONL o CSV.")
+	parser.add_argument("input", help="archivo .jsonl o .csv con columnas f, a, b (e id opcional)")
+	parser.add_argument("-o", "--output", help="archivo JSONL de salida (por defecto, la salida estándar)")
+	parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="número de procesos trabajadores")
+	parser.add_argument("--timeout", type=float, default=SOLVE_TIMEOUT, help="plazo en segundos por integral antes del respaldo numérico")
+	args = parser.parse_args(argv)
+
+	out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+	try:
+		run_batch(read_rows(args.input), out, max(1, args.workers), args.timeout)
+	finally:
+		if out is not sys.stdout:
+			out.close()
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,186 @@
+"""
+Pruebas de rendimiento del solver con tiempos por fase.
+
+Resuelve los nueve ejemplos de la pestaña "Ejemplos Rápidos" y un corpus
+más amplio (propias, límites infinitos, singularidades en un extremo,
+internas y varios puntos impropios), en frío y en el proceso actual. Para
+cada integral guarda el tiempo total, el de cada fase de
+IntegralResult.timings (parse, classify, asymptotic, antiderivative,
+limits, numeric, parts) y el pico de memoria de Python. El resultado se
+escribe en JSON para compararlo con una ejecución anterior:
+
+	python bench.py -o baseline.json
+	python bench.py --compare baseline.json
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import mpmath
+import sympy as sp
+
+import solver
+from examples import EXAMPLES
+
+PHASES = ["parse", "classify", "asymptotic", "antiderivative", "limits", "numeric", "parts"]
+
+# (categoría, f, a, b, veredicto esperado)
+CORPUS = [
+	("proper", "sin(x)", "0", "pi", "converge"),
+	("proper", "exp(x)", "0", "1", "converge"),
+	("proper", "x*exp(x)", "0", "1", "converge"),
+	("proper", "cos(x)**2", "0", "pi", "converge"),
+	("proper", "1/(1+x**2)", "-1", "1", "converge"),
+	("proper", "x**3 - 2*x", "-2", "3", "converge"),
+	("proper", "sqrt(1+x)", "0", "3", "converge"),
+	("proper", "log(1+x)", "0", "1", "converge"),
+	("proper", "atan(x)", "0", "1", "converge"),
+	("infinite", "1/x**3", "2", "oo", "converge"),
+	("infinite", "1/sqrt(x)", "1", "oo", "diverge"),
+	("infinite", "x*exp(-x)", "0", "oo", "converge"),
+	("infinite", "exp(-2*x)*sin(x)", "0", "oo", "converge"),
+	("infinite", "x/(1+x**2)", "0", "oo", "diverge"),
+	("infinite", "exp(x)", "-oo", "0", "converge"),
+	("infinite", "1/(x**2+4)", "-oo", "0", "converge"),
+	("infinite", "exp(-x**2)", "-oo", "oo", "converge"),
+	("infinite", "1/x**(3/2)", "1", "oo", "converge"),
+	("infinite", "exp(-x**2)*cos(x)**3/(1+x**4)", "0", "oo", "converge"),
+	("endpoint", "1/x", "0", "1", "diverge"),
+	("endpoint", "1/x**2", "0", "1", "diverge"),
+	("endpoint", "1/sqrt(1-x)", "0", "1", "converge"),
+	("endpoint", "1/sqrt(1-x**2)", "0", "1", "converge"),
+	("endpoint", "x**(-1/3)", "0", "8", "converge"),
+	("endpoint", "1/(x-2)", "0", "2", "diverge"),
+	("endpoint", "x*log(x)", "0", "1", "converge"),
+	("internal", "1/x**2", "-1", "1", "diverge"),
+	("internal", "1/(x-1)", "0", "2", "diverge"),
+	("internal", "1/(x*(x-1))", "-1", "2", "diverge"),
+	("internal", "1/(x-1)**2", "0", "3", "diverge"),
+	("internal", "tan(x)", "0", "3", "diverge"),
+	("internal", "1/(x-1)**(1/3)", "0", "2", "converge"),
+	("partitioned", "1/sqrt(x*(1-x))", "0", "1", "converge"),
+	("partitioned", "exp(-x)/sqrt(x)", "0", "oo", "converge"),
+	("partitioned", "1/x**2", "-1", "oo", "diverge"),
+	("partitioned", "1/(x**2-1)", "-oo", "oo", "diverge"),
+]
+
+
+def cases():
+	"""Lista de (id, categoría, f, a, b, veredicto esperado)."""
+	items = [(e["key"], "example", e["f"], e["a"], e["b"], e["verdict"]) for e in EXAMPLES]
+	items += [(f"{cat}: {f} [{a}, {b}]", cat, f, a, b, v) for cat, f, a, b, v in CORPUS]
+	return items
+
+
+def measure(f, a, b, repeat):
+	"""Mejor tiempo de `repeat` resoluciones en frío y pico de memoria de una más."""
+	best = None
+	for _ in range(repeat):
+		solver.clear_caches()
+		start = time.perf_counter()
+		result = solver.solve_integral(f, a, b)
+		seconds = time.perf_counter() - start
+		if best is None or seconds < best[0]:
+			best = (seconds, result)
+
+	solver.clear_caches()
+	tracemalloc.start()
+	solver.solve_integral(f, a, b)
+	_, peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	return best[0], best[1], peak
+
+
+def run(repeat=1, only=None):
+	report = {
+		"created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+		"python": platform.python_version(),
+		"sympy": sp.__version__,
+		"mpmath": mpmath.__version__,
+		"repeat": repeat,
+		"cases": {},
+	}
+	totals = {"seconds": 0.0, "phases": dict.fromkeys(PHASES, 0.0), "peak_kib": 0}
+	# Calentamiento: la primera resolución paga importaciones perezosas de SymPy
+	solver.solve_integral("x", "0", "1")
+	for case_id, category, f, a, b, expected in cases():
+		if only and only not in case_id:
+			continue
+		seconds, result, peak = measure(f, a, b, repeat)
+		phases = {name: round(result.timings.get(name, 0.0), 6) for name in PHASES}
+		report["cases"][case_id] = {
+			"category": category, "f": f, "a": a, "b": b,
+			"expected": expected, "verdict": result.verdict, "status": result.status,
+			"numeric_backup_used": result.numeric_backup_used,
+			"seconds": round(seconds, 6), "phases": phases, "peak_kib": round(peak / 1024),
+		}
+		totals["seconds"] += seconds
+		for name in PHASES:
+			totals["phases"][name] += phases[name]
+		totals["peak_kib"] = max(totals["peak_kib"], round(peak / 1024))
+		mark = "" if result.verdict == expected else f"  (esperado: {expected})"
+		print(f"{seconds:8.3f} s {peak / 1024:9.0f} KiB  {result.verdict or '-':9} {case_id}{mark}", file=sys.stderr)
+	totals["seconds"] = round(totals["seconds"], 6)
+	totals["phases"] = {k: round(v, 6) for k, v in totals["phases"].items()}
+	report["totals"] = totals
+	return report
+
+
+def compare(report, baseline, tolerance, min_delta):
+	"""Devuelve las líneas de regresión (tiempo, memoria o veredicto) frente a `baseline`."""
+	problems = []
+
+	def slower(new, old):
+		return new - old > max(min_delta, old * tolerance)
+
+	for case_id, case in report["cases"].items():
+		old = baseline.get("cases", {}).get(case_id)
+		if old is None:
+			continue
+		if case["verdict"] != old["verdict"]:
+			problems.append(f"{case_id}: veredicto {old['verdict']} -> {case['verdict']}")
+		if slower(case["seconds"], old["seconds"]):
+			problems.append(f"{case_id}: total {old['seconds']:.3f} s -> {case['seconds']:.3f} s")
+		for name in PHASES:
+			new_t, old_t = case["phases"].get(name, 0.0), old.get("phases", {}).get(name, 0.0)
+			if slower(new_t, old_t):
+				problems.append(f"{case_id}: fase {name} {old_t:.3f} s -> {new_t:.3f} s")
+		if case["peak_kib"] > old.get("peak_kib", 0) * (1 + tolerance) + 1024:
+			problems.append(f"{case_id}: memoria {old['peak_kib']} KiB -> {case['peak_kib']} KiB")
+	return problems
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="Mide el rendimiento del solver por fases.")
+	parser.add_argument("-o", "--output", help="archivo JSON donde guardar los resultados")
+	parser.add_argument("--compare", help="JSON de una ejecución anterior con el que comparar")
+	parser.add_argument("--repeat", type=int, default=3, help="repeticiones por integral (se guarda la mejor)")
+	parser.add_argument("--tolerance", type=float, default=0.25, help="aumento relativo tolerado antes de marcar regresión")
+	parser.add_argument("--min-delta", type=float, default=0.05, help="aumento absoluto mínimo (s) para marcar regresión")
+	parser.add_argument("--only", help="mide solo los casos cuyo id contiene este texto")
+	args = parser.parse_args(argv)
+
+	report = run(max(1, args.repeat), args.only)
+	print(f"Total: {report['totals']['seconds']:.3f} s  " + "  ".join(f"{k}={v:.3f}" for k, v in report["totals"]["phases"].items()), file=sys.stderr)
+
+	if args.output:
+		with open(args.output, "w", encoding="utf-8") as handle:
+			json.dump(report, handle, indent=2, ensure_ascii=False)
+
+	if args.compare:
+		with open(args.compare, encoding="utf-8") as handle:
+			baseline = json.load(handle)
+		problems = compare(report, baseline, args.tolerance, args.min_delta)
+		for line in problems:
+			print(f"REGRESIÓN {line}", file=sys.stderr)
+		if problems:
+			sys.exit(1)
+		print("Sin regresiones frente a la línea base.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,28 @@
+"""
+Caché compartida de funciones compiladas con `sp.lambdify`.
+
+Generar el código de una expresión cuesta mucho más que evaluarla, y la
+misma f se compilaba una y otra vez (cuadratura, límites numéricos,
+gráfica). Aquí se guarda una versión por (expresión, variable, backend).
+"""
+import sympy as sp
+
+from result_cache import ResultCache
+
+COMPILED_CACHE_MAX_ENTRIES = 512
+
+_functions = ResultCache(max_entries=COMPILED_CACHE_MAX_ENTRIES)
+
+
+def compiled(expr, var, backend='numpy'):
+	"""`sp.lambdify(var, expr, backend)`, compilada una sola vez por expresión y backend."""
+	key = (expr, var, backend)
+	function = _functions.get(key)
+	if function is None:
+		function = sp.lambdify(var, expr, backend)
+		_functions.put(key, function)
+	return function
+
+
+def clear_compiled():
+	_functions.clear()
@@ -0,0 +1,127 @@
+"""
+Ejemplos clásicos de la pestaña "Ejemplos Rápidos".
+
+Se usan en la interfaz y en las pruebas de rendimiento (bench.py), así que
+el veredicto esperado de cada uno queda registrado aquí.
+
+Sus resultados y gráficas se precalculan en un paquete en disco
+(`python examples.py`, o en segundo plano al arrancar la app) para que los
+botones respondan al instante. El paquete guarda la versión del solver y de
+plotting.py con que se generó y se descarta cuando cambian.
+"""
+import hashlib
+import os
+import pickle
+import sys
+import threading
+from importlib.metadata import version
+
+BUNDLE_PATH = os.environ.get(
+	"INTEGRALES_EXAMPLES_BUNDLE",
+	os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "examples_bundle.pkl"),
+)
+
+EXAMPLES = [
+	{"key": "ej1", "title": "Ej1: ∫ 1/x² dx de 1 a ∞ (Converge)", "label": "**Función:** 1/x² | **Límites:** a=1, b=∞",
+	 "f": "1/x**2", "a": "1", "b": "oo", "verdict": "converge"},
+	{"key": "ej2", "title": "Ej2: ∫ 1/√x dx de 0 a 1 (Converge)", "label": "**Función:** 1/√x | **Límites:** a=0, b=1",
+	 "f": "1/sqrt(x)", "a": "0", "b": "1", "verdict": "converge"},
+	{"key": "ej3", "title": "Ej3: ∫ 1/x dx de 1 a ∞ (Diverge)", "label": "**Función:** 1/x | **Límites:** a=1, b=∞",
+	 "f": "1/x", "a": "1", "b": "oo", "verdict": "diverge"},
+	{"key": "ej4", "title": "Ej4: ∫ ln(x) dx de 0 a 1 (Converge)", "label": "**Función:** ln(x) | **Límites:** a=0, b=1",
+	 "f": "log(x)", "a": "0", "b": "1", "verdict": "converge"},
+	{"key": "ej5", "title": "Ej5: ∫ 1/x^(5/3) dx de -1 a 1 (Diverge)", "label": "**Función:** 1/x^(5/3) | **Límites:** a=-1, b=1",
+	 "f": "1/x**(5/3)", "a": "-1", "b": "1", "verdict": "diverge"},
+	{"key": "ej6", "title": "Ej6: ∫ x² dx de 0 a 2 (Propia - Converge)", "label": "**Función:** x² | **Límites:** a=0, b=2",
+	 "f": "x**2", "a": "0", "b": "2", "verdict": "converge"},
+	{"key": "ej7", "title": "Ej7: ∫ e^(-x) dx de 0 a ∞ (Converge)", "label": "**Función:** e^(-x) | **Límites:** a=0, b=∞",
+	 "f": "exp(-x)", "a": "0", "b": "oo", "verdict": "converge"},
+	{"key": "ej8", "title": "Ej8: ∫ 1/(1+x²) dx de -∞ a ∞ (Converge)", "label": "**Función:** 1/(1+x²) | **Límites:** a=-∞, b=∞",
+	 "f": "1/(1+x**2)", "a": "-oo", "b": "oo", "verdict": "converge"},
+	{"key": "ej9", "title": "Ej9: ∫ x/√(x²+1) dx de 0 a ∞ (Diverge)", "label": "**Función:** x/√(x²+1) | **Límites:** a=0, b=∞",
+	 "f": "x/sqrt(x**2+1)", "a": "0", "b": "oo", "verdict": "diverge"},
+]
+
+
+_bundle = None
+_bundle_lock = threading.Lock()
+
+
+def bundle_version():
+	"""Versión del solver más el código de plotting.py y la versión de matplotlib."""
+	from solver import solver_version
+	digest = hashlib.sha256(solver_version().encode())
+	with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "plotting.py"), "rb") as handle:
+		digest.update(handle.read())
+	digest.update(version("matplotlib").encode())
+	return digest.hexdigest()[:16]
+
+
+def build_bundle(path=BUNDLE_PATH):
+	"""Resuelve (en procesos trabajadores) y grafica los ejemplos, y guarda el paquete en `path`."""
+	from sympy import Symbol
+	from plotting import GraphError, graph_png
+	from solver import parse_integral, solve_isolated
+
+	results, graphs = {}, {}
+	for example in EXAMPLES:
+		f, a, b = parse_integral(example["f"], example["a"], example["b"])
+		results[example["key"]] = solve_isolated(f, a, b)
+		try:
+			graphs[example["key"]] = graph_png(f, a, b, Symbol('x'))
+		except GraphError:
+			pass
+	bundle = {"version": bundle_version(), "results": results, "graphs": graphs}
+
+	os.makedirs(os.path.dirname(path), exist_ok=True)
+	temporary = f"{path}.{os.getpid()}.tmp"
+	with open(temporary, "wb") as handle:
+		pickle.dump(bundle, handle, protocol=pickle.HIGHEST_PROTOCOL)
+	os.replace(temporary, path)
+	return bundle
+
+
+def _read_bundle(path):
+	try:
+		with open(path, "rb") as handle:
+			bundle = pickle.load(handle)
+	except Exception:
+		return None
+	if not isinstance(bundle, dict) or bundle.get("version") != bundle_version():
+		return None
+	return bundle
+
+
+def get_bundle(build=False, wait=True, path=BUNDLE_PATH):
+	"""
+	Paquete de ejemplos de la versión actual, o None. Con `build` se genera
+	si falta o está desactualizado; con `wait=False` se devuelve None en vez
+	de esperar a que otro hilo termine de generarlo.
+	"""
+	global _bundle
+	if _bundle is not None:
+		return _bundle
+	if not _bundle_lock.acquire(blocking=wait):
+		return None
+	try:
+		if _bundle is None:
+			bundle = _read_bundle(path)
+			if bundle is None and build:
+				bundle = build_bundle(path)
+			_bundle = bundle
+		return _bundle
+	finally:
+		_bundle_lock.release()
+
+
+def main():
+	bundle = build_bundle()
+	for example in EXAMPLES:
+		result = bundle["results"][example["key"]]
+		mark = "" if result.verdict == example["verdict"] else f"  (esperado: {example['verdict']})"
+		print(f"{example['key']}: {result.verdict}{mark}", file=sys.stderr)
+	print(f"Paquete {bundle['version']} guardado en {BUNDLE_PATH}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+	main()
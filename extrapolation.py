@@ -0,0 +1,194 @@
+"""
+Límites numéricos por aceleración de sucesiones.
+
+Cuando `limit` de SymPy falla, el límite se estima evaluando la expresión
+en una sucesión geométrica de puntos (t = 2**k hacia ±oo, o separaciones
+2**-k del punto) con una sola llamada vectorizada, y extrapolando con el
+algoritmo épsilon de Wynn, que además da una estimación del error. Las
+diferencias entre términos consecutivos sirven también para detectar
+divergencia: si no decrecen, el límite no es finito.
+"""
+import math
+from dataclasses import dataclass
+
+import mpmath as mp
+import numpy as np
+import sympy as sp
+from sympy import oo
+
+from compiled import compiled
+
+# Términos de la sucesión: t = 2**k con k < LIMIT_POINTS (hasta ~1e14)
+LIMIT_POINTS = 48
+# Términos (los últimos antes del ruido de redondeo) que usa la extrapolación
+WYNN_TERMS = 14
+# Razón media entre diferencias consecutivas por debajo de la cual se extrapola
+CONVERGE_RATIO = 0.9
+# Razón a partir de la cual diferencias del mismo signo indican divergencia
+DIVERGE_RATIO = 0.97
+
+
+@dataclass
+class LimitEstimate:
+	"""
+	Límite estimado: `verdict` es "converge" (value finito, con su error),
+	"diverge" (value es oo, -oo o nan si oscila) o None si no es concluyente.
+	"""
+	verdict: str
+	value: object = None
+	error: float = math.inf
+
+
+def sequence_points(point, dir):
+	"""Puntos de la sucesión hacia `point` (lateral según dir '+' o '-' si es finito)."""
+	k = np.arange(LIMIT_POINTS, dtype=float)
+	if point == oo:
+		return 2.0 ** k
+	if point == -oo:
+		return -(2.0 ** k)
+	p = float(point)
+	# Separaciones que float64 aún distingue alrededor de p
+	smallest = 1e4 * np.finfo(float).eps * max(1.0, abs(p))
+	steps = 2.0 ** -k
+	steps = steps[steps >= smallest]
+	return p - steps if dir == '-' else p + steps
+
+
+def _evaluate(expr, var, ts):
+	"""expr en los puntos ts como float (nan donde no es real). Numpy vectorizado; si falla, mpmath."""
+	try:
+		f_np = compiled(expr, var, 'numpy')
+		with np.errstate(all='ignore'):
+			values = np.broadcast_to(np.asarray(f_np(ts)), ts.shape)
+		if np.iscomplexobj(values):
+			values = np.where(np.abs(values.imag) <= 1e-12 * (1 + np.abs(values.real)), values.real, np.nan)
+		return np.asarray(values, dtype=float)
+	except Exception:
+		pass
+	f_mp = compiled(expr, var, 'mpmath')
+	values = []
+	for t in ts:
+		try:
+			v = mp.mpmathify(f_mp(t))
+			values.append(float(v.real) if abs(v.imag) <= 1e-12 * (1 + abs(v.real)) else math.nan)
+		except Exception:
+			values.append(math.nan)
+	return np.array(values)
+
+
+def wynn_epsilon(sequence):
+	"""
+	Algoritmo épsilon de Wynn. Devuelve (estimación, error) tomando, de las
+	columnas pares de la tabla, la última diagonal con menor diferencia.
+	"""
+	s = [float(v) for v in sequence]
+	best, error = s[-1], abs(s[-1] - s[-2]) if len(s) > 1 else math.inf
+	previous, current = [0.0] * (len(s) + 1), s
+	column = 0
+	while len(current) > 1:
+		following = []
+		for j in range(len(current) - 1):
+			diff = current[j + 1] - current[j]
+			if diff == 0:
+				# La columna ya es constante: límite alcanzado
+				if column % 2 == 0:
+					return current[j + 1], 0.0
+				following = []
+				break
+			following.append(previous[j + 1] + 1.0 / diff)
+		column += 1
+		previous, current = current, following
+		if column % 2 == 0 and len(current) >= 2:
+			candidate, candidate_error = current[-1], abs(current[-1] - current[-2])
+			if math.isfinite(candidate) and candidate_error < error:
+				best, error = candidate, candidate_error
+	return best, error
+
+
+def classify_sequence(values):
+	"""Veredicto a partir de la sucesión de valores (ordenada hacia el punto límite)."""
+	infinite = np.isinf(values)
+	if infinite.any() and infinite[-1]:
+		return LimitEstimate("diverge", oo if values[-1] > 0 else -oo, 0.0)
+	values = values[np.isfinite(values)]
+	if len(values) < 8:
+		return LimitEstimate(None)
+
+	diffs = np.diff(values)
+	noise = 100 * np.finfo(float).eps * max(1.0, float(np.max(np.abs(values))))
+	settled = np.flatnonzero(np.abs(diffs) <= noise)
+	if settled.size and np.all(np.abs(diffs[settled[0]:]) <= 1e3 * noise):
+		# La sucesión ya se estabilizó al nivel del redondeo; la extrapolación de
+		# los términos previos solo se usa si confirma ese valor
+		value = float(values[settled[0] + 1])
+		if settled[0] >= 3:
+			extrapolated, error = wynn_epsilon(values[max(0, settled[0] + 2 - WYNN_TERMS):settled[0] + 2])
+			if abs(extrapolated - value) <= 1e3 * noise:
+				return LimitEstimate("converge", extrapolated, max(error, noise))
+		return LimitEstimate("converge", value, noise)
+
+	tail = diffs[-6:]
+	with np.errstate(all='ignore'):
+		ratios = np.abs(tail[1:]) / np.abs(tail[:-1])
+	ratios = ratios[np.isfinite(ratios) & (ratios > 0)]
+	if ratios.size == 0:
+		return LimitEstimate("converge", float(values[-1]), noise)
+	ratio = float(np.exp(np.mean(np.log(ratios))))
+	same_sign = np.all(tail > 0) or np.all(tail < 0)
+
+	if ratio < CONVERGE_RATIO:
+		value, error = wynn_epsilon(values[-WYNN_TERMS:])
+		return LimitEstimate("converge", value, max(error, noise))
+	if same_sign and ratio >= DIVERGE_RATIO:
+		return LimitEstimate("diverge", oo if tail[-1] > 0 else -oo, 0.0)
+	if not same_sign and ratio >= CONVERGE_RATIO:
+		# Oscila sin amortiguarse: el límite no existe
+		return LimitEstimate("diverge", sp.nan, 0.0)
+	return LimitEstimate(None)
+
+
+def numeric_limit(expr, var, point, dir=None):
+	"""
+	Estima lim_{var -> point} expr (lateral con dir '+' o '-'). Con dir None
+	en un punto finito se calculan ambos lados y deben coincidir.
+	"""
+	if dir is None and point not in (oo, -oo):
+		right = numeric_limit(expr, var, point, '+')
+		left = numeric_limit(expr, var, point, '-')
+		if right.verdict is None or left.verdict is None:
+			return LimitEstimate(None)
+		if right.verdict == left.verdict == "converge":
+			if abs(right.value - left.value) <= 10 * (right.error + left.error) + 1e-12 * max(1.0, abs(right.value)):
+				return LimitEstimate("converge", (right.value + left.value) / 2, max(right.error, left.error))
+			return LimitEstimate("diverge", sp.nan, 0.0)
+		if right.value == left.value:
+			return right
+		return LimitEstimate("diverge", sp.nan, 0.0)
+
+	try:
+		ts = sequence_points(point, dir)
+		values = _evaluate(expr, var, ts)
+	except Exception:
+		return LimitEstimate(None)
+	return classify_sequence(values)
+
+
+def numeric_limit_grid(expr, var, param, params, point, dir=None):
+	"""
+	Como numeric_limit (lateral si `point` es finito) para expr(var, param)
+	con cada valor de `params` a la vez: la malla sucesión × parámetros se
+	evalúa con una sola llamada vectorizada de numpy. Devuelve una lista de
+	LimitEstimate, todos no concluyentes si numpy no puede evaluar expr.
+	"""
+	params = np.asarray(params, dtype=float)
+	try:
+		ts = sequence_points(point, dir)
+		f_np = compiled(expr, (var, param), 'numpy')
+		with np.errstate(all='ignore'):
+			values = np.broadcast_to(np.asarray(f_np(ts[:, None], params[None, :])), (len(ts), len(params)))
+		if np.iscomplexobj(values):
+			values = np.where(np.abs(values.imag) <= 1e-12 * (1 + np.abs(values.real)), values.real, np.nan)
+		values = np.asarray(values, dtype=float)
+	except Exception:
+		return [LimitEstimate(None) for _ in params]
+	return [classify_sequence(values[:, j]) for j in range(len(params))]
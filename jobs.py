@@ -0,0 +1,174 @@
+"""
+Cola de resoluciones en segundo plano.
+
+Cada integral enviada se convierte en un trabajo con identificador que
+resuelve un hilo de la cola (con los procesos de workers.py), así que el
+hilo del script de Streamlit queda libre y la interfaz solo consulta el
+estado con `poll`. Un trabajo se cancela con `cancel` (p. ej. cuando el
+usuario edita la integral) o solo, si nadie lo consulta durante
+JOB_HEARTBEAT_TIMEOUT segundos (el usuario cerró la página).
+"""
+import atexit
+import dataclasses
+import threading
+import time
+import uuid
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from metrics import log_event, metrics
+from solver import solve_hybrid
+from workers import POOL_SIZE
+
+# Trabajos resueltos a la vez (cada uno ocupa hasta dos procesos trabajadores)
+JOB_WORKERS = POOL_SIZE
+# Un trabajo sin consultas durante este tiempo (s) se da por abandonado y se cancela
+JOB_HEARTBEAT_TIMEOUT = 10.0
+# Tiempo (s) que se conserva un trabajo terminado para que la interfaz lo recoja
+JOB_RETENTION_SECONDS = 120.0
+# Cada cuánto (s) se buscan trabajos abandonados o caducados
+REAP_INTERVAL = 1.0
+
+QUEUED, RUNNING, DONE, CANCELLED, FAILED = "queued", "running", "done", "cancelled", "failed"
+FINISHED = (DONE, CANCELLED, FAILED)
+
+
+@dataclass
+class Job:
+	"""
+	Estado de un trabajo. `step` y `partial` son el último paso terminado por
+	la vía simbólica y el resultado parcial correspondiente; `numeric` es el
+	resultado preliminar de la vía numérica, si llegó antes.
+	"""
+	id: str
+	f: object
+	a: object
+	b: object
+	var: str = 'x'
+	state: str = QUEUED
+	step: str = None
+	partial: object = None
+	numeric: object = None
+	result: object = None
+	error: str = None
+	submitted_at: float = field(default_factory=time.monotonic)
+	polled_at: float = field(default_factory=time.monotonic)
+	finished_at: float = None
+	cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
+
+	@property
+	def finished(self):
+		return self.state in FINISHED
+
+
+class JobQueue:
+	"""
+	`submit` devuelve el identificador del trabajo; `poll` devuelve una copia
+	de su estado (o None si no existe o ya caducó) y cuenta como señal de que
+	alguien sigue esperando; `cancel` lo detiene, mate o no su proceso.
+	`on_done(result)` se llama desde el hilo del trabajo al terminar bien,
+	aunque ya nadie lo esté consultando.
+	"""
+
+	def __init__(self, max_workers=JOB_WORKERS, heartbeat_timeout=JOB_HEARTBEAT_TIMEOUT):
+		self.heartbeat_timeout = heartbeat_timeout
+		self._jobs = {}
+		self._lock = threading.Lock()
+		self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="solve-job")
+		self._closed = threading.Event()
+		self._reaper = threading.Thread(target=self._reap, name="job-reaper", daemon=True)
+		self._reaper.start()
+
+	def submit(self, f, a, b, var='x', on_done=None):
+		job = Job(id=uuid.uuid4().hex, f=f, a=a, b=b, var=var)
+		with self._lock:
+			self._jobs[job.id] = job
+		metrics.count("jobs.submitted")
+		self._executor.submit(self._run, job, on_done)
+		return job.id
+
+	def poll(self, job_id):
+		with self._lock:
+			job = self._jobs.get(job_id)
+			if job is None:
+				return None
+			job.polled_at = time.monotonic()
+			return dataclasses.replace(job)
+
+	def cancel(self, job_id):
+		with self._lock:
+			job = self._jobs.get(job_id)
+			if job is None or job.finished:
+				return False
+			job.cancel_event.set()
+			return True
+
+	def _update(self, job, **changes):
+		with self._lock:
+			for name, value in changes.items():
+				setattr(job, name, value)
+
+	def _finish(self, job, state, **changes):
+		self._update(job, state=state, finished_at=time.monotonic(), **changes)
+		metrics.count(f"jobs.{state}")
+		seconds = job.finished_at - job.submitted_at
+		metrics.observe("jobs.total", seconds)
+		log_event("job", id=job.id, f=str(job.f), a=str(job.a), b=str(job.b), state=state, seconds=round(seconds, 4))
+
+	def _run(self, job, on_done):
+		if job.cancel_event.is_set():
+			self._finish(job, CANCELLED)
+			return
+		self._update(job, state=RUNNING)
+		metrics.observe("jobs.wait", time.monotonic() - job.submitted_at)
+		try:
+			result = solve_hybrid(
+				job.f, job.a, job.b, job.var,
+				on_numeric=lambda numeric: self._update(job, numeric=numeric),
+				on_progress=lambda step, partial: self._update(job, step=step, partial=partial),
+				cancel_event=job.cancel_event,
+			)
+		except CancelledError:
+			self._finish(job, CANCELLED)
+			return
+		except Exception as e:
+			self._finish(job, FAILED, error=f"{type(e).__name__}: {e}")
+			return
+		if on_done is not None:
+			on_done(result)
+		self._finish(job, DONE, result=result)
+
+	def _reap(self):
+		while not self._closed.wait(REAP_INTERVAL):
+			now = time.monotonic()
+			with self._lock:
+				abandoned = [
+					job.id for job in self._jobs.values()
+					if not job.finished and not job.cancel_event.is_set() and now - job.polled_at > self.heartbeat_timeout
+				]
+				for job_id in [job.id for job in self._jobs.values() if job.finished and now - job.finished_at > JOB_RETENTION_SECONDS]:
+					del self._jobs[job_id]
+			for job_id in abandoned:
+				if self.cancel(job_id):
+					metrics.count("jobs.abandoned")
+
+	def shutdown(self):
+		self._closed.set()
+		with self._lock:
+			for job in self._jobs.values():
+				job.cancel_event.set()
+		self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_job_queue():
+	"""Devuelve la cola compartida del proceso (se crea en el primer uso)."""
+	global _queue
+	with _queue_lock:
+		if _queue is None:
+			_queue = JobQueue()
+			atexit.register(_queue.shutdown)
+		return _queue
@@ -0,0 +1,99 @@
+"""
+Métricas de rendimiento del proceso.
+
+Cuenta aciertos de caché, plazos agotados, respaldos numéricos y modos de
+integral, y acumula los tiempos de cada fase (del solver y de la gráfica).
+Cada resolución o gráfica se emite además como una línea de log JSON en el
+logger "integrales.metrics", para poder agregarlas fuera de la aplicación.
+"""
+import json
+import logging
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+logger = logging.getLogger("integrales.metrics")
+if not logger.handlers:
+	_handler = logging.StreamHandler()
+	_handler.setFormatter(logging.Formatter("%(message)s"))
+	logger.addHandler(_handler)
+	logger.setLevel(logging.INFO)
+	logger.propagate = False
+
+
+class Metrics:
+	"""Contadores y tiempos acumulados (número, total y máximo), seguros entre hilos."""
+
+	def __init__(self):
+		self._lock = threading.Lock()
+		self._counters = Counter()
+		self._timers = {}
+		self.last_solve = None
+
+	def count(self, name, n=1):
+		with self._lock:
+			self._counters[name] += n
+
+	def observe(self, name, seconds):
+		with self._lock:
+			count, total, peak = self._timers.get(name, (0, 0.0, 0.0))
+			self._timers[name] = (count + 1, total + seconds, max(peak, seconds))
+
+	@contextmanager
+	def timer(self, name):
+		start = time.perf_counter()
+		try:
+			yield
+		finally:
+			self.observe(name, time.perf_counter() - start)
+
+	def snapshot(self):
+		"""Copia de los contadores y de los tiempos (con la media ya calculada)."""
+		with self._lock:
+			timers = {
+				name: {"count": count, "total": total, "mean": total / count, "max": peak}
+				for name, (count, total, peak) in sorted(self._timers.items())
+			}
+			return {"counters": dict(sorted(self._counters.items())), "timers": timers, "last_solve": self.last_solve}
+
+	def reset(self):
+		with self._lock:
+			self._counters.clear()
+			self._timers.clear()
+			self.last_solve = None
+
+
+metrics = Metrics()
+
+
+def log_event(event, **fields):
+	"""Escribe una línea JSON {"event": ..., "ts": ..., **fields} en el log de métricas."""
+	record = {"event": event, "ts": round(time.time(), 3), **fields}
+	logger.info(json.dumps(record, default=str, ensure_ascii=False))
+
+
+def record_solve(result, seconds, cache_hit):
+	"""Registra una resolución completa (ya mostrada o servida desde la caché)."""
+	metrics.count("solve.cache_hit" if cache_hit else "solve.cache_miss")
+	metrics.count(f"status.{result.status}")
+	if result.mode is not None:
+		metrics.count(f"mode.{result.mode}")
+	metrics.observe("solve.total", seconds)
+	if not cache_hit:
+		for name, value in result.counters.items():
+			metrics.count(f"solver.{name}", value)
+		for name, value in result.timings.items():
+			metrics.observe(f"phase.{name}", value)
+
+	phases = {name: round(value, 4) for name, value in result.timings.items()}
+	metrics.last_solve = {
+		"f": str(result.f), "a": str(result.a), "b": str(result.b),
+		"cache_hit": cache_hit, "seconds": round(seconds, 4), "phases": phases,
+		"counters": dict(result.counters), "peak_kib": result.peak_memory,
+	}
+	log_event(
+		"solve", f=str(result.f), a=str(result.a), b=str(result.b),
+		cache_hit=cache_hit, status=result.status, mode=result.mode, verdict=result.verdict,
+		seconds=round(seconds, 4), phases=phases, counters=dict(result.counters), peak_kib=result.peak_memory,
+	)
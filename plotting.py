@@ -0,0 +1,293 @@
+"""
+Muestreo de f(x) para la gráfica del área bajo la curva.
+
+En lugar de una malla fija, el muestreo parte de una malla gruesa por
+segmento (separando las singularidades) y va subdividiendo los tramos donde
+la curva cambia más rápido, sin pasar de un presupuesto fijo de puntos.
+La figura ya dibujada se guarda como PNG y se reutiliza mientras no cambien
+la función o los límites.
+"""
+import io
+import time
+
+from matplotlib.figure import Figure
+import numpy as np
+from sympy import oo
+
+from compiled import compiled
+from metrics import log_event, metrics
+from result_cache import ResultCache
+from solver import find_singularities, known_singularities, remember_singularities
+from workers import WorkerCrashedError, run_with_deadline
+
+# Número máximo de evaluaciones de f por gráfica
+SAMPLE_BUDGET = 800
+# Puntos iniciales por segmento antes de refinar
+INITIAL_POINTS = 33
+# Separación relativa (respecto al ancho del intervalo) alrededor de cada singularidad
+SINGULARITY_GAP = 1e-4
+# Plazo (s) de la búsqueda de singularidades en un proceso trabajador
+SINGULARITIES_TIMEOUT = 5
+
+# Caché de figuras renderizadas (PNG), acotada por tamaño total
+FIGURE_CACHE_MAX_ENTRIES = 128
+FIGURE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+_figures = ResultCache(max_entries=FIGURE_CACHE_MAX_ENTRIES, max_bytes=FIGURE_CACHE_MAX_BYTES)
+
+
+class GraphError(ValueError):
+	"""La gráfica no se pudo generar; el mensaje se muestra tal cual al usuario."""
+
+
+def _evaluate(f_np, xs):
+	with np.errstate(all='ignore'):
+		ys = f_np(xs)
+	ys = np.broadcast_to(np.asarray(ys), xs.shape)
+	if np.iscomplexobj(ys):
+		ys = np.real(ys)
+	ys = np.array(ys, dtype=float)
+	ys[~np.isfinite(ys)] = np.nan
+	return ys
+
+
+def _segments(start, end, singularities):
+	gap = SINGULARITY_GAP * (end - start)
+	points = sorted(set([start] + [s for s in singularities if start < s < end] + [end]))
+	segments = []
+	for i in range(len(points) - 1):
+		seg_start = points[i] + gap if i > 0 else points[i]
+		seg_end = points[i + 1] - gap if i < len(points) - 2 else points[i + 1]
+		if seg_start < seg_end:
+			segments.append((seg_start, seg_end))
+	return segments
+
+
+def _refine(f_np, xs, ys, budget, width):
+	"""Subdivide los tramos más largos en el plano (x, asinh(y)) hasta agotar el presupuesto."""
+	while len(xs) < budget:
+		finite = ys[np.isfinite(ys)]
+		scale = np.median(np.abs(finite)) if finite.size else 1.0
+		s = np.arcsinh(ys / (scale or 1.0))
+		s_range = np.nanmax(s) - np.nanmin(s) if finite.size else 1.0
+		dx = np.diff(xs) / width
+		ds = np.diff(s) / (s_range or 1.0)
+		# Tramos con un extremo no finito: posible borde del dominio
+		ds = np.where(np.isnan(ds), np.where(np.isnan(ys[:-1]) & np.isnan(ys[1:]), 0.0, 1.0), ds)
+		lengths = np.hypot(dx, ds)
+		# Curvatura: cambio de pendiente entre tramos consecutivos
+		if len(ds) > 1:
+			bend = np.abs(np.diff(np.arctan2(ds, dx)))
+			bend = np.nan_to_num(bend)
+			lengths[:-1] += 0.5 * bend * lengths[:-1]
+			lengths[1:] += 0.5 * bend * lengths[1:]
+		lengths[np.diff(xs) < 1e-12 * width] = 0.0
+
+		threshold = np.median(lengths) * 2 if len(lengths) > 4 else 0.0
+		candidates = np.nonzero(lengths > max(threshold, 1e-3))[0]
+		if candidates.size == 0:
+			break
+		take = min(candidates.size, budget - len(xs))
+		chosen = candidates[np.argsort(lengths[candidates])[::-1][:take]]
+		mids = (xs[chosen] + xs[chosen + 1]) / 2
+		mid_ys = _evaluate(f_np, mids)
+		xs = np.insert(xs, chosen + 1, mids)
+		ys = np.insert(ys, chosen + 1, mid_ys)
+		order = np.argsort(xs, kind='stable')
+		xs, ys = xs[order], ys[order]
+	return xs, ys
+
+
+def sample_function(f_np, start, end, singularities=(), budget=SAMPLE_BUDGET):
+	"""
+	Devuelve (x, y) para graficar f entre start y end. Los segmentos entre
+	singularidades se separan con un NaN para que la línea no las cruce.
+	"""
+	segments = _segments(start, end, [float(s) for s in singularities])
+	if not segments:
+		segments = [(start, end)]
+	width = end - start
+	per_segment = max(2, budget // len(segments))
+
+	xs_all, ys_all = [], []
+	for seg_start, seg_end in segments:
+		n0 = min(INITIAL_POINTS, per_segment)
+		xs = np.linspace(seg_start, seg_end, n0)
+		ys = _evaluate(f_np, xs)
+		xs, ys = _refine(f_np, xs, ys, per_segment, width)
+		if xs_all:
+			xs_all.append(np.array([np.nan]))
+			ys_all.append(np.array([np.nan]))
+		xs_all.append(xs)
+		ys_all.append(ys)
+	return np.concatenate(xs_all), np.concatenate(ys_all)
+
+
+def display_limit(xs, ys, percentile=99, cap=1000):
+	"""
+	Límite vertical para recortar polos: percentil de |y| ponderado por la
+	separación entre muestras, para que los puntos agrupados junto a una
+	singularidad no dominen la escala.
+	"""
+	finite = np.isfinite(xs) & np.isfinite(ys)
+	if not np.any(finite):
+		return 100
+	x_f, y_f = xs[finite], np.abs(ys[finite])
+	spacing = np.gradient(x_f) if len(x_f) > 1 else np.ones_like(x_f)
+	order = np.argsort(y_f)
+	weights = np.cumsum(np.abs(spacing[order]))
+	if weights[-1] <= 0:
+		return min(float(np.max(y_f)) * 1.5, cap)
+	idx = np.searchsorted(weights, weights[-1] * percentile / 100)
+	return min(float(y_f[order][min(idx, len(order) - 1)]) * 1.5, cap)
+
+
+def remember_graph(f, a, b, x, png):
+	"""Guarda un PNG ya generado (p. ej. precalculado) para graph_png(f, a, b, x)."""
+	_figures.put((f, a, b, x), png)
+
+
+def graph_png(f, a, b, x):
+	"""
+	PNG de la gráfica de f con el área entre a y b. Se dibuja una sola vez
+	por (f, a, b); las siguientes llamadas devuelven los bytes guardados.
+	"""
+	key = (f, a, b, x)
+	start = time.perf_counter()
+	png = _figures.get(key)
+	cache_hit = png is not None
+	metrics.count("graph.cache_hit" if cache_hit else "graph.cache_miss")
+	if not cache_hit:
+		png = _draw_graph(f, a, b, x)
+		_figures.put(key, png)
+	seconds = time.perf_counter() - start
+	metrics.observe("graph.total", seconds)
+	log_event("graph", f=str(f), a=str(a), b=str(b), cache_hit=cache_hit, seconds=round(seconds, 4), bytes=len(png))
+	return png
+
+
+def _graph_singularities(f, start, end, x):
+	"""
+	Singularidades en [start, end]: las que ya calculó la resolución o, si no,
+	las que encuentre un proceso trabajador antes de SINGULARITIES_TIMEOUT
+	(sp.simplify puede no terminar). Si no llega a tiempo, la gráfica se
+	muestrea sin separar singularidades.
+	"""
+	singularities = known_singularities(f, start, end, x)
+	if singularities is not None:
+		return singularities
+	try:
+		singularities = run_with_deadline(find_singularities, f, start, end, x, timeout=SINGULARITIES_TIMEOUT)
+	except (TimeoutError, WorkerCrashedError, MemoryError):
+		metrics.count("graph.singularities_timeout")
+		return []
+	remember_singularities(f, start, end, x, singularities)
+	return singularities
+
+
+def _draw_graph(f, a, b, x):
+	try:
+		start = -10.0 if a == -oo else (float(a) if hasattr(a, "is_number") and a.is_number else -1.0)
+		end = 10.0 if b == oo else (float(b) if hasattr(b, "is_number") and b.is_number else 1.0)
+	except Exception:
+		start, end = -10.0, 10.0
+
+	if start >= end:
+		end = start + 10.0
+
+	with metrics.timer("graph.singularities"):
+		singularities = _graph_singularities(f, start, end, x)
+
+	try:
+		with metrics.timer("graph.sampling"):
+			f_np = compiled(f, x, 'numpy')
+			x_vals, y_vals = sample_function(f_np, start, end, singularities)
+			y_limit = display_limit(x_vals, y_vals)
+			y_vals = np.clip(y_vals, -y_limit, y_limit)
+	except Exception as e:
+		raise GraphError(f"No se pudo graficar la función: {str(e)[:100]}")
+
+	if not np.any(np.isfinite(y_vals)):
+		raise GraphError("No se pudo generar la gráfica: la función no tiene valores finitos en el intervalo.")
+
+	render_start = time.perf_counter()
+	# Figure sin pyplot: no hay estado global, así que se puede dibujar desde
+	# cualquier hilo (p. ej. el que precalcula los ejemplos)
+	fig = Figure(figsize=(10, 6))
+	ax = fig.subplots()
+	try:
+		ax.plot(x_vals, y_vals, color='#3b82f6', linewidth=2, label=f"f(x) = {f}")
+
+		mask = np.isfinite(y_vals)
+		ax.fill_between(x_vals, 0, y_vals, where=mask, alpha=0.3, color='#3b82f6', label='Área bajo la curva')
+
+		if a != -oo and hasattr(a, "is_number") and a.is_number:
+			try:
+				ax.axvline(float(a), color='r', linestyle='--', label=f'Límite inferior: {a}', linewidth=2)
+			except Exception:
+				pass
+		if b != oo and hasattr(b, "is_number") and b.is_number:
+			try:
+				ax.axvline(float(b), color='g', linestyle='--', label=f'Límite superior: {b}', linewidth=2)
+			except Exception:
+				pass
+
+		ax.axhline(0, color='black', linewidth=0.5)
+		ax.set_title("🔍 Gráfica Interactiva: Visualiza el Área de la Integral", fontsize=16, color='#1e3a8a')
+		ax.set_xlabel("x", fontsize=12)
+		ax.set_ylabel("f(x)", fontsize=12)
+		ax.legend(loc='best')
+		ax.grid(True, alpha=0.3)
+
+		y_finite = y_vals[np.isfinite(y_vals)]
+		y_min, y_max = np.min(y_finite), np.max(y_finite)
+		y_range = y_max - y_min
+		if y_range < 0.1:
+			y_center = (y_max + y_min) / 2
+			ax.set_ylim(y_center - 1, y_center + 1)
+		else:
+			margin = y_range * 0.1
+			ax.set_ylim(max(-1000, y_min - margin), min(1000, y_max + margin))
+
+		buffer = io.BytesIO()
+		fig.savefig(buffer, format="png", bbox_inches="tight", dpi=200)
+		return buffer.getvalue()
+	finally:
+		metrics.observe("graph.render", time.perf_counter() - render_start)
+
+
+def sweep_png(result):
+	"""
+	PNG de un barrido paramétrico (sweep.SweepResult): valor de la integral
+	frente al parámetro donde converge; los valores en que diverge o que no
+	se decidieron se marcan en el borde inferior.
+	"""
+	converged = [(pt.param, pt.value) for pt in result.points if pt.verdict == "converge" and pt.value is not None and np.isfinite(pt.value)]
+	divergent = [pt.param for pt in result.points if pt.verdict == "diverge"]
+	undecided = [pt.param for pt in result.points if pt.verdict is None or (pt.verdict == "converge" and pt.value is None)]
+
+	fig = Figure(figsize=(10, 4.5))
+	ax = fig.subplots()
+	if converged:
+		xs, ys = np.array(converged).T
+		ax.plot(xs, ys, 'o-', color='#3b82f6', linewidth=2, markersize=4, label='Converge: valor de la integral')
+		finite = np.abs(ys[ys != 0])
+		# Cerca del umbral de convergencia el valor crece sin límite: escala logarítmica simétrica
+		if finite.size and np.max(finite) > 50 * np.median(finite):
+			ax.set_yscale('symlog', linthresh=float(np.median(finite)))
+	edge = ax.get_xaxis_transform()
+	if divergent:
+		ax.scatter(divergent, [0.04] * len(divergent), transform=edge, marker='x', color='#dc2626', s=40, label='Diverge')
+	if undecided:
+		ax.scatter(undecided, [0.04] * len(undecided), transform=edge, marker='o', facecolors='none', edgecolors='#6b7280', s=40, label='Sin decidir o sin valor')
+
+	ax.axhline(0, color='black', linewidth=0.5)
+	ax.set_title(f"Barrido de {result.param}: ∫ {result.f} dx de {result.a} a {result.b}", fontsize=14, color='#1e3a8a')
+	ax.set_xlabel(result.param, fontsize=12)
+	ax.set_ylabel("Valor de la integral", fontsize=12)
+	ax.grid(True, alpha=0.3)
+	ax.legend(loc='best')
+
+	buffer = io.BytesIO()
+	fig.savefig(buffer, format="png", bbox_inches="tight", dpi=150)
+	return buffer.getvalue()
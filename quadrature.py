@@ -0,0 +1,376 @@
+"""
+Cuadratura numérica con escalado de precisión.
+
+Primero se aplica una regla de doble exponencial (tanh-sinh en intervalos
+finitos, exp-sinh y sinh-sinh en los infinitos) vectorizada con numpy en
+float64, que tolera singularidades integrables en los extremos y da una
+estimación del error. Solo si no se alcanza la tolerancia (o la función no
+se puede evaluar en float64) se recurre a `mp.quad` con más precisión.
+
+`improper_test` decide si la parte impropia converge sin fiarse del valor
+que devuelva la cuadratura: integra f sobre truncamientos que crecen (o
+huecos junto a la singularidad que se reducen) por décadas y mira cómo
+evolucionan los incrementos.
+"""
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+
+import mpmath as mp
+import numpy as np
+import sympy as sp
+from sympy import oo
+
+from compiled import compiled
+
+# Tolerancia relativa y absoluta de la regla en float64
+QUAD_RTOL = 1e-10
+QUAD_ATOL = 1e-13
+# Niveles de refinamiento: paso h = 2**-level
+MIN_LEVEL = 3
+MAX_LEVEL = 8
+# Extremo del parámetro t (los pesos fuera de [-T, T] no son representables)
+T_FINITE = 6.0
+T_INFINITE = 4.5
+# Precisión (dígitos) de mpmath cuando float64 no basta
+MP_DPS = 30
+# Prueba de convergencia: número de décadas y nodos de Gauss-Legendre por década
+TEST_DECADES_INFINITE = 15
+TEST_DECADES_ENDPOINT = 12
+TEST_MIN_DECADES = 5
+TEST_NODES = 32
+
+
+@dataclass
+class QuadResult:
+	"""Valor de la integral, error estimado y método usado ("float64" o "mpmath")."""
+	value: object
+	error: float
+	method: str
+
+
+@dataclass
+class ConvergenceTest:
+	"""
+	Veredicto de la prueba numérica ("converge", "diverge" o None si no es
+	concluyente), razón media entre incrementos consecutivos y, si diverge,
+	el valor simbólico del límite (oo, -oo o nan si oscila).
+	"""
+	verdict: str
+	ratio: float = None
+	value: object = None
+
+
+@lru_cache(maxsize=None)
+def _finite_rule(level):
+	# t >= 0; cada t > 0 aporta un nodo junto a cada extremo.
+	# dist = 1 - tanh(u) calculado sin cancelación para que los nodos se acerquen al extremo.
+	h = 2.0 ** -level
+	t = np.arange(0, T_FINITE + h / 2, h)
+	u = math.pi / 2 * np.sinh(t)
+	dist = 2.0 / (1.0 + np.exp(2 * u))
+	weights = math.pi / 2 * np.cosh(t) / np.cosh(u) ** 2
+	return h, dist, weights
+
+
+@lru_cache(maxsize=None)
+def _half_line_rule(level):
+	h = 2.0 ** -level
+	t = np.arange(-T_INFINITE, T_INFINITE + h / 2, h)
+	u = math.pi / 2 * np.sinh(t)
+	nodes = np.exp(u)
+	weights = math.pi / 2 * np.cosh(t) * nodes
+	return h, nodes, weights
+
+
+@lru_cache(maxsize=None)
+def _real_line_rule(level):
+	h = 2.0 ** -level
+	t = np.arange(-T_INFINITE, T_INFINITE + h / 2, h)
+	u = math.pi / 2 * np.sinh(t)
+	return h, np.sinh(u), math.pi / 2 * np.cosh(t) * np.cosh(u)
+
+
+def _values(f_np, xs):
+	"""f en los nodos como float64; None si algún valor no es real y finito."""
+	with np.errstate(all='ignore'):
+		ys = np.broadcast_to(np.asarray(f_np(xs)), xs.shape)
+	if np.iscomplexobj(ys):
+		if np.any(np.abs(ys.imag) > 1e-12 * (1 + np.abs(ys.real))):
+			return None
+		ys = ys.real
+	ys = np.asarray(ys, dtype=float)
+	if not np.all(np.isfinite(ys)):
+		return None
+	return ys
+
+
+def _outer_term(terms):
+	"""Último término no nulo: lo que aporta la regla junto a un extremo."""
+	nonzero = np.flatnonzero(terms)
+	return abs(terms[nonzero[-1]]) if nonzero.size else 0.0
+
+
+def _level_sum(f_np, a, b, level):
+	"""
+	(suma, cola) de la regla con paso 2**-level. La cola son los últimos
+	términos de cada lado (incluidos los nodos que se confunden con un
+	extremo y se descartan); si no es despreciable, la regla está truncada.
+	"""
+	if math.isinf(a) and math.isinf(b):
+		h, nodes, weights = _real_line_rule(level)
+		ys = _values(f_np, nodes)
+		if ys is None:
+			return None
+		terms = weights * ys
+		return h * np.sum(terms), h * (abs(terms[0]) + abs(terms[-1]))
+
+	if math.isinf(a) or math.isinf(b):
+		h, offsets, weights = _half_line_rule(level)
+		end = b if math.isinf(a) else a
+		nodes = end + offsets if math.isinf(b) else end - offsets
+		keep = nodes != end
+		ys = _values(f_np, nodes[keep])
+		if ys is None:
+			return None
+		terms = np.zeros_like(weights)
+		terms[keep] = weights[keep] * ys
+		# offsets crecen con t: el extremo finito está al principio
+		return h * np.sum(terms), h * (_outer_term(terms[::-1]) + abs(terms[-1]))
+
+	h, dist, weights = _finite_rule(level)
+	half = (b - a) / 2
+	left, right = a + half * dist, b - half * dist
+	keep_left, keep_right = left > a, right < b
+	keep_left[0] = keep_right[0] = False
+	ys_mid = _values(f_np, np.array([(a + b) / 2]))
+	ys_left = _values(f_np, left[keep_left])
+	ys_right = _values(f_np, right[keep_right])
+	if ys_mid is None or ys_left is None or ys_right is None:
+		return None
+	left_terms = np.zeros_like(weights)
+	right_terms = np.zeros_like(weights)
+	left_terms[keep_left] = half * weights[keep_left] * ys_left
+	right_terms[keep_right] = half * weights[keep_right] * ys_right
+	total = half * weights[0] * ys_mid[0] + np.sum(left_terms) + np.sum(right_terms)
+	return h * total, h * (_outer_term(left_terms) + _outer_term(right_terms))
+
+
+def de_quad(f_np, a, b, rtol=QUAD_RTOL, atol=QUAD_ATOL):
+	"""
+	Integra f_np (vectorizada) entre a y b (float, admite ±inf) en float64.
+	Devuelve (valor, error estimado) o None si f no es evaluable en los nodos.
+	"""
+	previous = None
+	for level in range(MIN_LEVEL, MAX_LEVEL + 1):
+		current = _level_sum(f_np, a, b, level)
+		if current is None:
+			return None
+		value, tail = current
+		if not math.isfinite(value):
+			return None
+		if previous is not None:
+			error = abs(value - previous) + tail
+			if error <= max(atol, rtol * abs(value)):
+				return value, error
+		previous = value
+	return value, error
+
+
+def _as_float_bound(value):
+	if value == oo:
+		return math.inf
+	if value == -oo:
+		return -math.inf
+	return float(value)
+
+
+def integrate(f, a, b, x, rtol=QUAD_RTOL, dps=MP_DPS):
+	"""
+	Integral numérica de la expresión f entre a y b. Usa float64 si la regla
+	alcanza `rtol`; si no, `mp.quad` con `dps` dígitos. None si ambos fallan.
+	"""
+	try:
+		a_num, b_num = _as_float_bound(a), _as_float_bound(b)
+	except (TypeError, ValueError):
+		return None
+
+	estimate = None
+	try:
+		f_np = compiled(f, x, 'numpy')
+		estimate = de_quad(f_np, a_num, b_num, rtol)
+	except Exception:
+		pass
+	if estimate is not None:
+		value, error = estimate
+		if error <= max(QUAD_ATOL, rtol * abs(value)):
+			return QuadResult(value, error, "float64")
+
+	try:
+		f_mp = compiled(f, x, 'mpmath')
+		with mp.workdps(dps):
+			lo = mp.mpf(a_num) if math.isfinite(a_num) else (mp.inf if a_num > 0 else -mp.inf)
+			hi = mp.mpf(b_num) if math.isfinite(b_num) else (mp.inf if b_num > 0 else -mp.inf)
+			points = [lo, 0, hi] if mp.isinf(lo) and mp.isinf(hi) else [lo, hi]
+			value, error = mp.quad(f_mp, points, error=True)
+			return QuadResult(+value, float(error), "mpmath")
+	except Exception:
+		if estimate is not None:
+			return QuadResult(estimate[0], estimate[1], "float64")
+		return None
+
+
+def integrand_scale(f, a, b, x, nodes=TEST_NODES):
+	"""
+	Escala de la integral que no depende del valor calculado: máximo de |f|
+	en una muestra de puntos interiores por la longitud del intervalo (1 si
+	es infinito, con los puntos repartidos por décadas). 1 si no se puede
+	muestrear.
+	"""
+	try:
+		a_num, b_num = _as_float_bound(a), _as_float_bound(b)
+		f_np = compiled(f, x, 'numpy')
+	except Exception:
+		return 1.0
+	if math.isfinite(a_num) and math.isfinite(b_num):
+		xs = a_num + (b_num - a_num) * np.arange(1, nodes + 1) / (nodes + 1)
+		span = abs(b_num - a_num)
+	else:
+		offsets = np.logspace(-3, 6, nodes)
+		if math.isfinite(a_num):
+			xs = a_num + offsets
+		elif math.isfinite(b_num):
+			xs = b_num - offsets
+		else:
+			xs = np.concatenate((-offsets[::-1], [0.0], offsets))
+		span = 1.0
+	try:
+		with np.errstate(all='ignore'):
+			ys = np.abs(np.broadcast_to(np.asarray(f_np(xs)), xs.shape))
+		ys = np.asarray(ys, dtype=float)
+	except Exception:
+		return 1.0
+	ys = ys[np.isfinite(ys)]
+	if ys.size == 0:
+		return 1.0
+	return float(ys.max()) * span
+
+
+@lru_cache(maxsize=None)
+def _decade_rule():
+	# Gauss-Legendre en u = ln(s / s0) sobre una década: s = s0 * exp(u), ds = s du
+	nodes, weights = np.polynomial.legendre.leggauss(TEST_NODES)
+	span = math.log(10.0)
+	return np.exp((nodes + 1) / 2 * span), weights / 2 * span
+
+
+def _decade_increments(f_np, origin, direction, starts):
+	"""
+	(∫ f, ∫ |f|) de f(origin + direction*s) ds sobre cada década [s0, 10*s0]
+	de `starts`, evaluando f una sola vez sobre todos los nodos. None si f da
+	NaN o no es real. Los incrementos de ∫ f se cortan en la primera década
+	donde f oscila más de lo que la regla resuelve.
+	"""
+	factors, weights = _decade_rule()
+	s = starts[:, None] * factors[None, :]
+	xs = origin + direction * s
+	with np.errstate(all='ignore'):
+		ys = np.broadcast_to(np.asarray(f_np(xs.ravel())), (xs.size,))
+		if np.iscomplexobj(ys):
+			if np.any(np.abs(ys.imag) > 1e-12 * (1 + np.abs(ys.real))):
+				return None
+			ys = ys.real
+		ys = np.asarray(ys, dtype=float).reshape(xs.shape)
+		if np.any(np.isnan(ys)):
+			return None
+		increments = np.sum(ys * s * weights[None, :], axis=1)
+		absolute = np.sum(np.abs(ys) * s * weights[None, :], axis=1)
+	# Con demasiados cambios de signo por década la regla no resuelve f (oscila):
+	# solo se usan las décadas anteriores
+	sign_changes = np.sum(np.diff(np.sign(ys), axis=1) != 0, axis=1)
+	unresolved = np.flatnonzero(sign_changes > TEST_NODES // 8)
+	if unresolved.size:
+		increments = increments[:unresolved[0]]
+	return increments, absolute
+
+
+def _classify_increments(increments):
+	"""Veredicto a partir de los incrementos de las integrales parciales (hacia el extremo impropio)."""
+	if not np.all(np.isfinite(increments)):
+		# f desborda float64 cerca del extremo impropio
+		last = increments[~np.isfinite(increments)][-1]
+		return ConvergenceTest("diverge", math.inf, oo if last > 0 else -oo if last < 0 else sp.nan)
+
+	total = abs(float(np.sum(increments)))
+	tail = increments[-4:]
+	magnitudes = np.abs(tail)
+	if np.all(magnitudes <= 1e-15 * max(1.0, total)):
+		return ConvergenceTest("converge", 0.0)
+
+	same_sign = np.all(tail > 0) or np.all(tail < 0)
+	with np.errstate(all='ignore'):
+		ratios = magnitudes[1:] / magnitudes[:-1]
+	ratios = ratios[np.isfinite(ratios) & (ratios > 0)]
+	if ratios.size == 0:
+		return ConvergenceTest(None)
+	ratio = float(np.exp(np.mean(np.log(ratios))))
+
+	if ratio < 0.7:
+		return ConvergenceTest("converge", ratio)
+	if same_sign and ratio >= 0.99:
+		return ConvergenceTest("diverge", ratio, oo if tail[-1] > 0 else -oo)
+	if ratio > 1.5:
+		# Crece sin cambiar de signo (infinito) o alternando (el límite no existe)
+		value = (oo if tail[-1] > 0 else -oo) if same_sign else sp.nan
+		return ConvergenceTest("diverge", ratio, value)
+	return ConvergenceTest(None, ratio)
+
+
+def improper_test(f, x, a, b, end):
+	"""
+	Prueba numérica de convergencia de la integral de f entre a y b cuando el
+	extremo `end` ("lower" o "upper") es infinito o singular y el otro no.
+	Las integrales parciales se calculan por décadas: hasta 10**15 veces el
+	ancho inicial hacia el infinito, o hasta 10**-12 del ancho junto a la
+	singularidad. Incrementos que decrecen geométricamente indican
+	convergencia; incrementos constantes o crecientes, divergencia.
+	"""
+	try:
+		a_num, b_num = _as_float_bound(a), _as_float_bound(b)
+		f_np = compiled(f, x, 'numpy')
+	except Exception:
+		return ConvergenceTest(None)
+
+	if end == "upper":
+		origin, other, direction = (a_num, a_num, 1.0) if math.isinf(b_num) else (b_num, a_num, -1.0)
+		infinite = math.isinf(b_num)
+	else:
+		origin, other, direction = (b_num, b_num, -1.0) if math.isinf(a_num) else (a_num, b_num, 1.0)
+		infinite = math.isinf(a_num)
+	if math.isinf(origin):
+		return ConvergenceTest(None)
+
+	if infinite:
+		scale = max(1.0, abs(origin))
+		starts = scale * 10.0 ** np.arange(TEST_DECADES_INFINITE)
+	else:
+		width = abs(other - origin)
+		# Sin bajar de la resolución de float64 alrededor de `origin`
+		resolvable = math.log10(width / (1e4 * np.finfo(float).eps * max(1.0, abs(origin))))
+		decades = min(TEST_DECADES_ENDPOINT, int(resolvable))
+		if decades < TEST_MIN_DECADES:
+			return ConvergenceTest(None)
+		starts = width * 10.0 ** -np.arange(1, decades + 1, dtype=float)
+
+	try:
+		sums = _decade_increments(f_np, origin, direction, starts)
+	except Exception:
+		return ConvergenceTest(None)
+	if sums is None:
+		return ConvergenceTest(None)
+	increments, absolute = sums
+	if len(increments) >= TEST_MIN_DECADES:
+		return _classify_increments(increments)
+	# f oscila: solo se puede concluir convergencia absoluta a partir de ∫ |f|
+	test = _classify_increments(absolute)
+	return test if test.verdict == "converge" else ConvergenceTest(None)
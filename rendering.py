@@ -0,0 +1,623 @@
+"""
+Resolución y presentación paso a paso de una integral en Streamlit.
+
+Este módulo carga SymPy, numpy y el motor de resolución, así que main.py
+solo lo importa al resolver la primera integral: la página se muestra sin
+esperar a esas importaciones.
+"""
+import time
+
+import numpy as np
+import streamlit as st
+import sympy as sp
+from sympy import oo, Symbol, latex
+
+from examples import EXAMPLES, get_bundle
+from jobs import CANCELLED, FAILED, QUEUED, get_job_queue
+from metrics import record_solve
+from result_cache import ResultCache
+from result_store import get_result_store
+from solver import (
+	IntegralResult, InvalidInputError, canonical_key, parse_integral, remember_singularities,
+	safe_float, solve_integral,
+)
+
+# Avance de la barra de progreso y texto al terminar cada paso del solver
+STEP_PROGRESS = {
+	"classify": (33, "Paso 2: calculando la antiderivada..."),
+	"antiderivative": (66, "Pasos 3 a 5: evaluando límites y convergencia..."),
+	"parts": (66, "Resolviendo en paralelo los tramos que faltan..."),
+}
+
+
+# Caché de resoluciones compartida entre sesiones y reruns (LRU acotado + TTL)
+SOLVE_CACHE_MAX_ENTRIES = 256
+SOLVE_CACHE_TTL_SECONDS = 6 * 60 * 60
+
+
+@st.cache_resource
+def get_solve_cache():
+	return ResultCache(max_entries=SOLVE_CACHE_MAX_ENTRIES, ttl=SOLVE_CACHE_TTL_SECONDS)
+
+
+def cached_result(key):
+	"""
+	Resultado guardado para `key`: primero en la caché del proceso y después
+	en el almacén en disco compartido con los demás procesos (que se copia a
+	la caché del proceso para las siguientes consultas).
+	"""
+	cache = get_solve_cache()
+	result = cache.get(key)
+	store = get_result_store()
+	if result is None and store is not None:
+		result = store.get(key)
+		if result is not None:
+			cache.put(key, result)
+	return result
+
+
+def store_result(key, result, cache=None):
+	"""
+	Guarda el resultado en la caché del proceso (`cache`, por defecto
+	get_solve_cache()) y en el almacén compartido. Un resultado en el que se
+	agotó algún plazo depende de la carga del servidor (ver
+	IntegralResult.hit_deadline), así que no se guarda en ninguno de los dos:
+	la siguiente consulta lo vuelve a intentar.
+	"""
+	if result.hit_deadline:
+		return
+	(cache if cache is not None else get_solve_cache()).put(key, result)
+	store = get_result_store()
+	if store is not None:
+		store.put(key, result)
+
+
+
+def preload_examples():
+	"""
+	Copia los resultados y gráficas precalculados de los ejemplos (si el
+	paquete en disco está al día) a las cachés de resolución y de figuras.
+	No espera si el paquete todavía se está generando.
+	"""
+	bundle = get_bundle(wait=False)
+	if bundle is None:
+		return
+	from plotting import remember_graph
+
+	cache = get_solve_cache()
+	for example in EXAMPLES:
+		key = canonical_key(example["f"], example["a"], example["b"])
+		result = bundle["results"].get(example["key"])
+		if key is not None and result is not None and cache.get(key + ('x',)) is None:
+			cache.put(key + ('x',), result)
+		png = bundle["graphs"].get(example["key"])
+		if png is not None:
+			f, a, b = parse_integral(example["f"], example["a"], example["b"])
+			remember_graph(f, a, b, Symbol('x'), png)
+
+
+# Cada cuánto (s) la página consulta el estado de la resolución en curso
+JOB_POLL_SECONDS = 0.5
+
+
+def resolver_integral(f_str, a_str, b_str, var='x', where="manual"):
+	"""
+	Resuelve la integral y muestra cada paso en la posición `where` de la
+	página. Si la misma integral (tras el parseo) ya se resolvió en cualquier
+	sesión o en otro proceso, se reutiliza el resultado guardado (ver
+	cached_result) sin volver a llamar a SymPy.
+	Si no, se envía como trabajo a la cola de jobs.py y la página lo va
+	consultando (ver show_solve); la resolución anterior de la sesión, si
+	seguía en curso, se cancela.
+	"""
+	discard_solve()
+	start = time.perf_counter()
+	solve = {"inputs": (f_str, a_str, b_str, var), "where": where, "job_id": None, "result": None}
+	key = canonical_key(f_str, a_str, b_str)
+	result = solve_integral(f_str, a_str, b_str, var) if key is None else cached_result(key + (var,))
+	if result is not None:
+		record_solve(result, time.perf_counter() - start, cache_hit=key is not None)
+		_remember_analysis(result)
+		solve["result"] = result
+	else:
+		# get_solve_cache es un recurso de Streamlit: se obtiene aquí, en el hilo
+		# del script, y no en el del trabajo
+		cache = get_solve_cache()
+
+		def on_done(result):
+			# En el hilo del trabajo: el resultado se guarda aunque nadie lo esté esperando
+			store_result(key + (var,), result, cache)
+			record_solve(result, time.perf_counter() - start, cache_hit=False)
+			_remember_analysis(result)
+
+		f, a, b = (sp.sympify(k) for k in key)
+		solve["job_id"] = get_job_queue().submit(f, a, b, var, on_done=on_done)
+	st.session_state.solve = solve
+	show_solve(where)
+
+
+def _remember_analysis(result):
+	if result.mode is not None and not result.mode.startswith("infinite"):
+		# La gráfica reutiliza el análisis de singularidades hecho en el trabajador
+		remember_singularities(result.f, result.a, result.b, Symbol(result.var), result.singularities)
+
+
+def current_solve(where=None):
+	"""Resolución guardada en la sesión (solo si se mostró en `where`, si se indica)."""
+	solve = st.session_state.get("solve")
+	if solve is None or (where is not None and solve["where"] != where):
+		return None
+	return solve
+
+
+def discard_solve(where=None):
+	"""Olvida la resolución de la sesión y cancela su trabajo si seguía en curso."""
+	solve = current_solve(where)
+	if solve is None:
+		return
+	if solve["job_id"] is not None:
+		get_job_queue().cancel(solve["job_id"])
+	del st.session_state.solve
+
+
+def show_solve(where):
+	"""Muestra la resolución de la sesión si corresponde a `where`: el resultado final o el trabajo en curso."""
+	solve = current_solve(where)
+	if solve is None:
+		return
+	if solve["result"] is not None:
+		render_result(solve["result"])
+	else:
+		_job_panel(solve["job_id"])
+
+
+@st.fragment(run_every=JOB_POLL_SECONDS)
+def _job_panel(job_id):
+	# Solo se vuelve a ejecutar este fragmento en cada consulta, no la página entera
+	job = get_job_queue().poll(job_id)
+	solve = st.session_state.get("solve")
+	if solve is None or solve["job_id"] != job_id:
+		return
+	if job is None or job.state == CANCELLED:
+		del st.session_state.solve
+		st.warning("⚠️ La resolución se interrumpió. Vuelve a pulsar el botón para resolver la integral.")
+		return
+	if job.finished:
+		if job.state == FAILED:
+			job.result = IntegralResult(f=job.f, a=job.a, b=job.b, var=job.var, status="error", message=job.error)
+		solve["result"], solve["job_id"] = job.result, None
+		# Sin trabajo pendiente la página deja de consultar y muestra el resultado final
+		st.rerun()
+
+	if job.state == QUEUED:
+		value, text = 0, "En cola: esperando un proceso libre..."
+	else:
+		value, text = STEP_PROGRESS.get(job.step, (0, "Paso 1: clasificando la integral..."))
+	st.progress(value, text=text)
+	if job.numeric is not None:
+		render_numeric_preview(st.empty(), job.numeric)
+	if job.partial is not None:
+		render_result(job.partial, job.step)
+
+
+def render_numeric_preview(placeholder, result):
+	if result.verdict == "diverge":
+		placeholder.info("⏳ La prueba numérica indica que la integral diverge — SymPy sigue buscando la forma cerrada exacta...")
+		return
+	value = safe_float(result.value) if result.value is not None else None
+	if value is not None:
+		placeholder.info(f"⏳ Valor numérico preliminar: {value} — SymPy sigue buscando la forma cerrada exacta...")
+
+
+def _limit_arrow(step):
+	side = {'+': "^{+}", '-': "^{-}"}.get(step.dir, "")
+	return r"\lim_{" + latex(step.var) + r" \to " + latex(step.point) + side + "}"
+
+
+def render_classification(result):
+	a, b, c, mode = result.a, result.b, result.c, result.mode
+	analysis_notes = []
+
+	st.write("**Paso 1: Identificación del Tipo de Integral**")
+
+	c_latex = latex(c) if c is not None else "c"
+
+	if mode == "partitioned":
+		points = ", ".join(f"${latex(s)}$" for s in result.singularities)
+		analysis_notes.append(f"Esta es una integral impropia con **varios puntos impropios** (singularidades en {points}" + (" y límites infinitos)." if oo in (a, b) or -oo in (a, b) else ")."))
+		analysis_notes.append(f"Se divide en {len(result.pieces)} integrales, cada una con un solo extremo impropio:")
+		st.latex(r"\int_{" + latex(a) + "}^{" + latex(b) + r"} f(x) \, dx = " + " + ".join(
+			r"\int_{" + latex(lo) + "}^{" + latex(hi) + r"} f(x) \, dx" for lo, hi, _ in result.pieces
+		))
+		analysis_notes.append("Los tramos se resuelven en paralelo. Si uno de ellos diverge, la integral completa **DIVERGE** y no hace falta terminar los demás.")
+	elif mode == "internal_singular":
+		analysis_notes.append(f"Esta es una integral impropia por **singularidad interna** (discontinuidad en $c={c_latex}$), donde ${latex(a)} < {c_latex} < {latex(b)}$.")
+		analysis_notes.append("Se debe dividir en dos integrales impropias:")
+		st.latex(r"\int_{" + latex(a) + "}^{" + latex(b) + r"} f(x) dx = \lim_{t_1 \to " + c_latex + r"^-} \int_{" + latex(a) + "}^{t_1} f(x) dx + \lim_{t_2 \to " + c_latex + r"^+} \int_{t_2}^{" + latex(b) + r"} f(x) dx")
+		analysis_notes.append("Si una de las dos partes diverge, la integral completa **DIVERGE**.")
+	elif mode == "infinite_both":
+		analysis_notes.append(r"Esta es una integral impropia por **límite infinito doble** ($-\infty$ a $\infty$).")
+		analysis_notes.append("Se resuelve dividiendo en dos integrales en un punto arbitrario $c$ (usamos $c=0$ por simplicidad):")
+		st.latex(r"\int_{-\infty}^{\infty} f(x) \, dx = \lim_{t_1 \to -\infty} \int_{t_1}^{0} f(x) \, dx + \lim_{t_2 \to \infty} \int_{0}^{t_2} f(x) \, dx")
+		analysis_notes.append("Si una de las dos partes diverge, la integral completa **DIVERGE**.")
+	elif mode == "infinite_upper":
+		analysis_notes.append("Esta es una integral impropia por **límite infinito superior**. Se resuelve como:")
+		st.latex(r"\int_{" + latex(a) + r"}^\infty f(x) \, dx = \lim_{t \to \infty} \int_{" + latex(a) + r"}^t f(x) \, dx")
+		analysis_notes.append(r"Se evaluará $F(t)-F(a)$ y se tomará el límite $t \to \infty$.")
+	elif mode == "infinite_lower":
+		analysis_notes.append("Esta es una integral impropia por **límite infinito inferior**. Se resuelve como:")
+		st.latex(r"\int_{-\infty}^{" + latex(b) + r"} f(x) \, dx = \lim_{t \to -\infty} \int_t^{" + latex(b) + r"} f(x) \, dx")
+		analysis_notes.append(r"Se evaluará $F(b)-F(t)$ y se tomará el límite $t \to -\infty$.")
+	elif mode == "singular_lower":
+		analysis_notes.append(f"Esta es una integral impropia por **singularidad en el límite inferior** (discontinuidad en $a={latex(a)}$). Se resuelve como:")
+		st.latex(r"\int_{" + latex(a) + "}^{" + latex(b) + r"} f(x) \, dx = \lim_{\epsilon \to " + latex(a) + r"^{+}} \int_{\epsilon}^{" + latex(b) + r"} f(x) \, dx")
+		analysis_notes.append(r"Se evaluará $F(b)-F(\epsilon)$ y se tomará el límite $\epsilon \to " + latex(a) + r"^{+}$.")
+	elif mode == "singular_upper":
+		analysis_notes.append(f"Esta es una integral impropia por **singularidad en el límite superior** (discontinuidad en $b={latex(b)}$). Se resuelve como:")
+		st.latex(r"\int_{" + latex(a) + "}^{" + latex(b) + r"} f(x) \, dx = \lim_{\epsilon \to " + latex(b) + r"^{-}} \int_{" + latex(a) + r"}^{\epsilon} f(x) \, dx")
+		analysis_notes.append(r"Se evaluará $F(\epsilon)-F(a)$ y se tomará el límite $\epsilon \to " + latex(b) + r"^{-}$.")
+	else:
+		analysis_notes.append("Esta es una **integral propia** (límites finitos y función continua en el intervalo de integración). Se calcula $F(b) - F(a)$ directamente.")
+
+	for note in analysis_notes:
+		st.markdown(note)
+
+	st.write("**Función dada**:")
+	st.latex(f"f(x) = {latex(result.f)}")
+	st.write(f"**Límites de Integración**: de ${latex(a)}$ a ${latex(b)}$")
+
+
+def _asymptotic_approach(test):
+	if test.point in (oo, -oo):
+		return r"x \to " + latex(test.point)
+	return r"x \to " + latex(test.point) + ("^{-}" if test.end == "upper" else "^{+}")
+
+
+def render_asymptotic(result):
+	"""Paso 2 cuando la prueba asintótica ya decide la divergencia y no se calcula F."""
+	st.write("**Paso 2: Prueba Asintótica de Convergencia (sin calcular la antiderivada)**")
+	st.markdown("Comparamos $f(x)$ cerca de cada extremo impropio con una integral $p$, cuya convergencia se conoce:")
+	st.latex(r"\int_1^\infty \frac{dx}{x^q} \text{ converge} \iff q > 1, \qquad \int_0^1 \frac{dx}{x^q} \text{ converge} \iff q < 1")
+	for test in result.asymptotic:
+		arrow = _asymptotic_approach(test)
+		if test.exponent is None:
+			st.markdown(f"Cerca de ${arrow}$, $f(x)$ crece al menos como $1/|x - c|$ (comparación en el límite con $q = 1$):")
+			st.latex(r"f(x) \sim " + latex(test.leading) + r" \quad (" + arrow + ")")
+		else:
+			st.markdown(f"Cerca de ${arrow}$, el término principal de $f(x)$ es:")
+			st.latex(r"f(x) \sim " + latex(test.leading) + r" \quad (" + arrow + r"), \qquad q = " + latex(test.exponent))
+			if test.exponent == 1 and test.leading.has(sp.log):
+				st.markdown(r"Con $q = 1$ decide el factor logarítmico: $\int \frac{dx}{x \, |\log x|^m}$ converge solo si $m > 1$.")
+		if test.verdict == "converge":
+			st.markdown("Por comparación en el límite, esta parte **converge**.")
+		else:
+			st.markdown("Por comparación en el límite, esta parte **diverge**, así que la integral completa diverge y no hace falta calcular la antiderivada.")
+
+
+def render_antiderivative(result):
+	if result.F_status == "ok":
+		st.write("**Paso 2: Encontrar la Antiderivada Indefinida $F(x)$**")
+		st.latex(r"\int f(x) dx = F(x) = " + latex(result.F) + r" + C")
+		st.markdown("**Nota**: En la integral definida, la constante $C$ se cancela.")
+	elif result.F_status == "partial":
+		st.write("**Paso 2: Encontrar la Antiderivada Indefinida $F(x)$**")
+		st.markdown("Integramos $f(x)$ término a término. SymPy no encontró una antiderivada cerrada para una parte $g(x)$ de la suma, que se integrará numéricamente:")
+		st.latex(r"\int f(x) dx = F(x) + \int g(x) dx")
+		st.latex(r"F(x) = " + latex(result.F) + r" + C, \qquad g(x) = " + latex(result.residual))
+	elif result.F_status == "timeout":
+		st.warning("⏱️ El cálculo de la antiderivada está tomando demasiado tiempo. Usaremos métodos numéricos de respaldo.")
+	else:
+		st.warning("⚠️ SymPy no pudo calcular la antiderivada simbólicamente. Continuaremos con evaluación numérica de respaldo.")
+
+
+def render_limits(result):
+	a, b, mode = result.a, result.b, result.mode
+
+	if result.numeric_backup_used:
+		if result.verdict == "diverge":
+			st.markdown("Se usó la prueba numérica de convergencia: las integrales parciales, calculadas sobre truncamientos cada vez más próximos al extremo impropio, no se estabilizan.")
+			st.latex(r"\text{Límite estimado de las integrales parciales: } " + latex(result.value))
+			return
+		if mode == "proper":
+			st.write("**Paso 3 & 4: Evaluación y Cálculo Explícito del Límite**")
+			st.success(f"✅ Resultado numérico aproximado: {safe_float(result.value)}")
+		else:
+			st.markdown("Se usó evaluación numérica de respaldo (cuadratura de doble exponencial, con mpmath si hace falta) para la integral impropia.")
+			st.latex(r"\text{Valor numérico aproximado: } " + latex(sp.N(result.value)))
+		return
+
+	if mode == "proper" and result.evaluation is not None:
+		F_b, F_a = result.evaluation
+		st.write("**Paso 3 & 4: Evaluación y Cálculo Explícito del Límite**")
+		st.markdown(r"Aplicamos el Teorema Fundamental del Cálculo:")
+		st.latex(r"\int_{" + latex(a) + "}^{" + latex(b) + r"} f(x) \, dx = F(" + latex(b) + ") - F(" + latex(a) + ")")
+		st.latex(r"= \left[" + latex(F_b) + r"\right] - \left[" + latex(F_a) + r"\right]")
+		value_display = safe_float(result.value)
+		if value_display is None:
+			st.error("❌ No se pudo mostrar el resultado. El valor puede ser complejo o indefinido.")
+		elif abs(value_display - np.pi) < 1e-10:
+			st.latex(r"= \pi")
+		else:
+			st.latex(r"= " + latex(value_display))
+		return
+
+	if not result.limits:
+		return
+
+	if mode in ("internal_singular", "infinite_both"):
+		t1, t2 = (step.var for step in result.limits)
+		if mode == "internal_singular":
+			c_val = result.c if result.c is not None else 0
+			bounds = [(a, c_val), (c_val, b)]
+			evaluations = [(t1, a), (b, t2)]
+			sides = ["izquierdo", "derecho"]
+		else:
+			bounds = [(-oo, 0), (0, oo)]
+			evaluations = [(0, t1), (t2, 0)]
+			sides = ["inferior", "superior"]
+		for i, (step, (lo, hi), (upper, lower), side) in enumerate(zip(result.limits, bounds, evaluations, sides), start=1):
+			st.markdown(f"**Desarrollo detallado de la Parte {i}**:")
+			st.latex(r"\int_{" + latex(lo) + "}^{" + latex(hi) + r"} f(x)\,dx = " + _limit_arrow(step) + r" \left(" + latex(step.upper) + " - " + latex(step.lower) + r"\right)")
+			st.markdown(f"**Parte {i}: Límite de $\\int_{{{latex(lo)}}}^{{{latex(hi)}}} f(x) dx$ (límite {side})**")
+			st.latex(_limit_arrow(step) + r" \left[ F(" + latex(upper) + ") - F(" + latex(lower) + r") \right] = " + latex(safe_float(step.value)))
+		return
+
+	step = result.limits[0]
+	if mode == "infinite_upper":
+		st.markdown(r"Sustituimos el límite superior infinito con $t$:")
+	elif mode == "infinite_lower":
+		st.markdown(r"Sustituimos el límite inferior infinito con $t$:")
+	elif mode == "singular_lower":
+		st.markdown(r"Sustituimos el límite inferior singular con $\epsilon$ y tomamos el límite lateral $\epsilon \to a^{+}$:")
+	elif mode == "singular_upper":
+		st.markdown(r"Sustituimos el límite superior singular con $\epsilon$ y tomamos el límite lateral $\epsilon \to b^{-}$:")
+	st.latex(_limit_arrow(step) + r" \left[ " + latex(step.simplified) + r" \right] = " + latex(step.value))
+
+
+def render_residual(result):
+	"""Parte de f sin antiderivada cerrada, integrada numéricamente (F_status "partial")."""
+	a, b = result.a, result.b
+	st.markdown("**Parte numérica**: integramos $g(x)$ con cuadratura de doble exponencial.")
+	st.latex(r"\int_{" + latex(a) + "}^{" + latex(b) + r"} g(x) \, dx \approx " + latex(sp.N(result.residual_value)))
+
+
+def render_parts(result):
+	"""Un tramo por pestaña, cada uno con su propio desarrollo paso a paso."""
+	st.write("**Pasos 2 a 4: Resolución de cada tramo**")
+	tabs = st.tabs([f"Tramo {i}: [{lo}, {hi}]" for i, (lo, hi, _) in enumerate(result.pieces, 1)])
+	parts = result.parts or [None] * len(result.pieces)
+	for tab, part in zip(tabs, parts):
+		with tab:
+			if part is not None:
+				render_result(part)
+			elif result.verdict == "diverge":
+				st.info("Este tramo no se terminó de resolver: otro tramo ya diverge, así que la integral completa diverge.")
+			else:
+				st.info("⏳ Resolviendo este tramo...")
+
+
+def render_verdict(result):
+	st.write("**Paso 5: Análisis de Convergencia (Conclusión Final)**")
+
+	if result.mode == "partitioned" and result.parts:
+		for i, ((lo, hi, _), part) in enumerate(zip(result.pieces, result.parts), 1):
+			value = "sin resolver" if part is None else "sin decidir" if part.value is None else f"${latex(part.value)}$"
+			st.markdown(f"**Resultado del tramo {i}** $[{latex(lo)}, {latex(hi)}]$: {value}")
+		if result.verdict == "diverge":
+			st.error("❌ **La integral DIVERGE** (al menos uno de los tramos diverge).")
+		elif result.verdict == "converge":
+			st.success(f"✅ **La integral CONVERGE**. Resultado: {safe_float(result.value)}")
+			st.write(f"**Suma total:** ${latex(result.value)}$")
+			st.write("**Explicación detallada**: Todos los tramos son finitos, por lo tanto la integral converge.")
+		else:
+			st.warning("⚠️ No se pudo determinar con certeza si la integral converge o diverge (algún tramo quedó sin decidir).")
+		return
+
+	if result.mode in ("internal_singular", "infinite_both") and result.limits:
+		parts = [safe_float(step.value) for step in result.limits]
+		st.markdown(f"**Resultado de la Parte 1**: ${latex(parts[0])}$")
+		st.markdown(f"**Resultado de la Parte 2**: ${latex(parts[1])}$")
+		if result.residual_value is not None:
+			st.markdown(f"**Resultado de la parte numérica** $\\int g(x)\\,dx$: ${latex(sp.N(result.residual_value))}$")
+		if result.reason == "missing":
+			st.error("❌ **La integral DIVERGE** (uno de los límites no existe).")
+		elif result.reason == "oscillating":
+			st.error("❌ **La integral DIVERGE** (uno de los límites oscila sin tender a ningún valor).")
+		elif result.verdict == "diverge":
+			st.error("❌ **La integral DIVERGE** (uno de los límites es infinito).")
+			if result.mode == "internal_singular":
+				st.write(f"**Aclaración Importante**: Uno o ambos límites laterales resultaron en $\\pm \\infty$ (Parte 1: ${latex(parts[0])}$, Parte 2: ${latex(parts[1])}$). Aunque SymPy pueda devolver un valor principal de Cauchy, la integral es DIVERGENTE porque no existe la suma de las partes.")
+			else:
+				st.write("**Explicación detallada**: Al menos uno de los límites laterales tiende a infinito, por lo tanto la integral no converge.")
+		else:
+			st.success(f"✅ **La integral CONVERGE**. Resultado: {safe_float(result.value)}")
+			st.write(f"**Suma total:** ${latex(result.value)}$")
+			st.write("**Explicación detallada**: Ambos límites son finitos, por lo tanto la integral converge.")
+		return
+
+	if result.verdict == "diverge" and result.reason == "undefined":
+		st.error("❌ **La integral DIVERGE** (el límite no existe o es indefinido).")
+	elif result.verdict == "diverge" and result.reason == "oscillating":
+		st.error(f"❌ **La integral DIVERGE** (el límite oscila entre los valores de ${latex(result.value)}$ sin tender a ninguno).")
+	elif result.verdict == "diverge":
+		st.error("❌ **La integral DIVERGE** (el límite tiende a infinito).")
+	elif result.verdict == "converge":
+		st.success(f"✅ **La integral CONVERGE**. Resultado: {latex(result.value)}")
+	else:
+		st.warning("⚠️ No se pudo determinar con certeza si la integral converge o diverge.")
+
+
+def render_result(result, step=None):
+	"""
+	Muestra en Streamlit un IntegralResult producido por el motor. Con
+	`step` ("classify", "antiderivative" o "parts") el resultado es parcial y
+	solo se muestran los pasos terminados hasta ese.
+	"""
+	if result.status == "invalid_input":
+		st.error(f"❌ {result.message}")
+		return
+
+	if result.swapped:
+		st.warning("⚠️ El límite inferior es mayor que el superior. Intercambiando límites...")
+
+	if result.status == "equal_limits":
+		st.warning("⚠️ Los límites son iguales. La integral es cero trivialmente.")
+		st.success("✅ Resultado: 0")
+		return
+
+	if result.status == "timeout":
+		st.error("⏱️ **Timeout**: El cálculo está tomando demasiado tiempo. Esta función puede ser demasiado compleja para evaluar simbólicamente.")
+		st.info("💡 **Sugerencia**: Intenta simplificar la función o usar límites de integración más pequeños.")
+		return
+	if result.status == "memory":
+		st.error("💾 **Error de Memoria**: La función requiere demasiados recursos para calcular.")
+		st.info("💡 **Sugerencia**: Intenta con una función más simple o límites más acotados.")
+		return
+	if result.status == "error":
+		st.error(f"❌ **Error inesperado en el cálculo**: {result.message[:200]}")
+		st.info("""
+		💡 **Tips de sintaxis**:
+		- Usa **'x'** como variable
+		- **`**` para potencias (ej. x**2)
+		- **x**(1/3) para ∛x
+		- **sqrt(x)** para √x
+		- **oo** para ∞
+		- **log(x)** para ln(x)
+		- **exp(x)** para eˣ
+		- **E** para la constante e
+		
+		📝 **Ejemplo**: `1/sqrt(1+x)` o `exp(-x**2)`
+		""")
+		with st.expander("🔧 Detalles técnicos del error (para debugging)"):
+			st.code(f"Error completo:\n{result.message}")
+			st.code(f"Traceback:\n{result.details}")
+		return
+
+	if result.domain_warning:
+		st.warning("⚠️ **Nota sobre el Dominio**: La función contiene una raíz de índice par que puede generar **valores complejos** en parte del intervalo (x < 0). SymPy trabajará con números complejos si es necesario.")
+
+	st.subheader("📊 Análisis Completo Paso a Paso")
+	render_classification(result)
+	if step == "classify":
+		return
+	if result.F_status == "skipped":
+		render_asymptotic(result)
+		render_verdict(result)
+		return
+	if result.mode == "partitioned":
+		render_parts(result)
+		if step != "parts":
+			render_verdict(result)
+		return
+	render_antiderivative(result)
+	if step == "antiderivative":
+		return
+	render_limits(result)
+	if result.residual_value is not None:
+		render_residual(result)
+	render_verdict(result)
+
+
+# Caché de barridos paramétricos compartida entre sesiones
+SWEEP_CACHE_MAX_ENTRIES = 64
+
+# Nombre en la tabla de cada veredicto y método de sweep.SweepPoint
+SWEEP_VERDICTS = {"converge": "✅ Converge", "diverge": "❌ Diverge", None: "⚠️ Sin decidir"}
+SWEEP_METHODS = {"antiderivative": "Antiderivada común", "asymptotic": "Prueba asintótica", "numeric": "Numérico"}
+
+
+@st.cache_resource
+def get_sweep_cache():
+	return ResultCache(max_entries=SWEEP_CACHE_MAX_ENTRIES, ttl=SOLVE_CACHE_TTL_SECONDS)
+
+
+def resolver_barrido(f_str, a_str, b_str, param, start, stop, count, var='x'):
+	"""
+	Barre `param` en `count` valores equiespaciados de `start` a `stop` (ver
+	sweep.sweep_parsed) en un proceso trabajador con plazo SWEEP_TIMEOUT, y
+	muestra la tabla y la gráfica. El resultado queda en la sesión para
+	volver a mostrarlo mientras no cambien los datos.
+	"""
+	from sweep import SWEEP_TIMEOUT, SweepResult, parse_sweep, sweep_parsed
+	from workers import WorkerCrashedError, get_pool
+
+	inputs = (f_str, a_str, b_str, param, start, stop, count, var)
+	try:
+		f, a, b = parse_sweep(f_str, a_str, b_str, param, var)
+	except InvalidInputError as e:
+		st.session_state.sweep = {"inputs": inputs, "result": SweepResult(status="invalid_input", message=str(e))}
+		show_sweep(inputs)
+		return
+	values = tuple(float(v) for v in np.linspace(start, stop, int(count)))
+	key = (sp.srepr(f), sp.srepr(a), sp.srepr(b), param, var, values)
+	cache = get_sweep_cache()
+	result = cache.get(key)
+	if result is None:
+		with st.spinner(f"Calculando la antiderivada con {param} simbólico y evaluando {len(values)} valores..."):
+			try:
+				result = get_pool().run(sweep_parsed, f, a, b, param, values, var, timeout=SWEEP_TIMEOUT)
+			except TimeoutError:
+				result = SweepResult(f=f, a=a, b=b, var=var, param=param, status="timeout")
+			except WorkerCrashedError as e:
+				result = SweepResult(f=f, a=a, b=b, var=var, param=param, status="error", message=str(e))
+		if result.status == "ok":
+			cache.put(key, result)
+	st.session_state.sweep = {"inputs": inputs, "result": result}
+	show_sweep(inputs)
+
+
+def show_sweep(inputs):
+	"""Muestra el barrido de la sesión si se hizo con estos mismos datos."""
+	sweep = st.session_state.get("sweep")
+	if sweep is not None and sweep["inputs"][:len(inputs)] == inputs:
+		render_sweep(sweep["result"])
+
+
+def _sweep_ranges(points):
+	"""Tramos consecutivos con el mismo veredicto: lista de (veredicto, primer valor, último valor)."""
+	ranges = []
+	for point in points:
+		if ranges and ranges[-1][0] == point.verdict:
+			ranges[-1][2] = point.param
+		else:
+			ranges.append([point.verdict, point.param, point.param])
+	return ranges
+
+
+def render_sweep(result):
+	if result.status == "invalid_input":
+		st.error(f"❌ {result.message}")
+		return
+	if result.status == "timeout":
+		st.error("⏱️ **Timeout**: El barrido está tomando demasiado tiempo.")
+		st.info("💡 **Sugerencia**: Reduce el número de puntos o simplifica la función.")
+		return
+	if result.status == "error":
+		st.error(f"❌ **Error inesperado en el barrido**: {result.message[:200]}")
+		return
+
+	x, p = Symbol(result.var), Symbol(result.param)
+	st.subheader(f"📐 Barrido de {result.param}")
+	st.latex(r"\int_{" + latex(result.a) + "}^{" + latex(result.b) + "} " + latex(result.f) + r" \, d" + result.var)
+	if result.F is not None:
+		st.markdown(f"**Antiderivada común** (calculada una sola vez con ${latex(p)}$ simbólico):")
+		st.latex(f"F({latex(x)}) = {latex(result.F)}")
+	else:
+		st.info("ℹ️ No hay antiderivada simbólica común: cada valor del parámetro se resolvió por separado.")
+
+	st.markdown("**Mapa de convergencia:**")
+	for verdict, first, last in _sweep_ranges(result.points):
+		where = f"{result.param} = {first:g}" if first == last else f"{result.param} ∈ [{first:g}, {last:g}]"
+		st.write(f"- {SWEEP_VERDICTS[verdict]} para {where}")
+
+	from plotting import sweep_png
+	st.image(sweep_png(result), use_column_width=True)
+	st.dataframe({
+		result.param: [point.param for point in result.points],
+		"Veredicto": [SWEEP_VERDICTS[point.verdict] for point in result.points],
+		"Valor": ["—" if point.value is None else f"{point.value:.10g}" for point in result.points],
+		"Método": [SWEEP_METHODS[point.method] for point in result.points],
+	}, hide_index=True, use_container_width=True)
+	counts = ", ".join(f"{SWEEP_METHODS[method]}: {total}" for method, total in result.counts().items())
+	seconds = sum(result.timings.values())
+	st.caption(f"{len(result.points)} valores en {seconds:.2f} s ({counts}).")
@@ -0,0 +1,66 @@
+"""
+Caché en memoria de resultados: LRU acotada con caducidad (TTL).
+
+Es segura entre hilos, así que una sola instancia se puede compartir entre
+todas las sesiones de Streamlit del proceso.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+
+class ResultCache:
+	"""
+	Guarda hasta `max_entries` valores; cada uno caduca a los `ttl` segundos.
+	Con `max_bytes`, además se expulsan los menos usados hasta que la suma de
+	`size_of(valor)` quede por debajo del límite.
+	"""
+
+	def __init__(self, max_entries=256, ttl=None, max_bytes=None, size_of=len):
+		self.max_entries = max_entries
+		self.ttl = ttl
+		self.max_bytes = max_bytes
+		self.size_of = size_of
+		self._data = OrderedDict()
+		self._bytes = 0
+		self._lock = threading.Lock()
+
+	def _size(self, value):
+		return self.size_of(value) if self.max_bytes is not None else 0
+
+	def _pop(self, key):
+		_, value = self._data.pop(key)
+		self._bytes -= self._size(value)
+
+	def get(self, key, default=None):
+		with self._lock:
+			item = self._data.get(key)
+			if item is None:
+				return default
+			stored_at, value = item
+			if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+				self._pop(key)
+				return default
+			self._data.move_to_end(key)
+			return value
+
+	def put(self, key, value):
+		with self._lock:
+			if key in self._data:
+				self._pop(key)
+			self._data[key] = (time.monotonic(), value)
+			self._bytes += self._size(value)
+			while len(self._data) > self.max_entries or (self.max_bytes is not None and self._bytes > self.max_bytes and len(self._data) > 1):
+				self._pop(next(iter(self._data)))
+
+	def clear(self):
+		with self._lock:
+			self._data.clear()
+			self._bytes = 0
+
+	def __contains__(self, key):
+		return self.get(key) is not None
+
+	def __len__(self):
+		with self._lock:
+			return len(self._data)
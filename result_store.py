@@ -0,0 +1,190 @@
+"""
+Almacén en disco de resoluciones compartido entre procesos.
+
+Con varios procesos de Streamlit detrás de un balanceador, la caché en
+memoria solo sirve al proceso que hizo el cálculo. Este almacén guarda cada
+IntegralResult (pickle comprimido con zlib) en una base SQLite local, con
+clave el hash de la integral canónica más la versión del solver, así que lo
+resuelto en un proceso se sirve desde cualquier otro. SQLite en modo WAL
+permite lecturas concurrentes mientras otro proceso escribe.
+
+Las entradas caducan a los `ttl` segundos y, si el archivo supera
+`max_bytes`, se expulsan primero las de otras versiones del solver y luego
+las usadas hace más tiempo. Caducidad y tamaño se revisan en la primera
+escritura de cada proceso y luego cada EVICT_EVERY_WRITES, no en todas:
+sumar los tamaños recorre la tabla entera. Cualquier error de SQLite se
+trata como un fallo de caché: el almacén nunca impide resolver.
+"""
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+
+from metrics import log_event, metrics
+
+STORE_PATH = os.environ.get(
+	"INTEGRALES_RESULT_STORE",
+	os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "results.sqlite3"),
+)
+STORE_TTL_SECONDS = 7 * 24 * 60 * 60
+STORE_MAX_BYTES = 256 * 1024 * 1024
+# Tras expulsar se deja el almacén en esta fracción de max_bytes, para no expulsar en cada escritura
+STORE_LOW_WATER = 0.9
+# Escrituras (por proceso) entre dos revisiones de caducidad y tamaño
+EVICT_EVERY_WRITES = 64
+# Precisión (s) con que se actualiza la fecha de último uso; evita una escritura por cada lectura
+ACCESS_RESOLUTION = 60.0
+# Espera máxima (s) por el bloqueo de escritura de otro proceso
+BUSY_TIMEOUT = 5.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+	key TEXT PRIMARY KEY,
+	version TEXT NOT NULL,
+	created REAL NOT NULL,
+	accessed REAL NOT NULL,
+	size INTEGER NOT NULL,
+	payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed);
+"""
+
+
+def store_key(key, version):
+	"""Hash de la clave canónica (tupla de cadenas, ver solver.canonical_key) más la versión del solver."""
+	return hashlib.sha256("\0".join(key + (version,)).encode()).hexdigest()
+
+
+class ResultStore:
+	"""
+	`get(key)` y `put(key, result)` con `key` la clave canónica de la
+	integral (más la variable). Cada hilo usa su propia conexión.
+	"""
+
+	def __init__(self, path=STORE_PATH, version=None, ttl=STORE_TTL_SECONDS, max_bytes=STORE_MAX_BYTES):
+		if version is None:
+			from solver import solver_version
+			version = solver_version()
+		self.path = path
+		self.version = version
+		self.ttl = ttl
+		self.max_bytes = max_bytes
+		self._local = threading.local()
+		self._init_lock = threading.Lock()
+		self._ready = False
+		self._writes = 0
+		self._writes_lock = threading.Lock()
+
+	def _connect(self):
+		conn = getattr(self._local, "conn", None)
+		if conn is None:
+			os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+			conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, isolation_level=None)
+			conn.execute("PRAGMA journal_mode=WAL")
+			conn.execute("PRAGMA synchronous=NORMAL")
+			with self._init_lock:
+				if not self._ready:
+					conn.executescript(_SCHEMA)
+					self._ready = True
+			self._local.conn = conn
+		return conn
+
+	def _failed(self, operation, error):
+		metrics.count("store.error")
+		log_event("store_error", operation=operation, error=f"{type(error).__name__}: {error}")
+
+	def get(self, key, default=None):
+		digest = store_key(key, self.version)
+		now = time.time()
+		try:
+			conn = self._connect()
+			row = conn.execute("SELECT created, accessed, payload FROM results WHERE key = ?", (digest,)).fetchone()
+			if row is None or now - row[0] > self.ttl:
+				metrics.count("store.miss")
+				return default
+			if now - row[1] > ACCESS_RESOLUTION:
+				conn.execute("UPDATE results SET accessed = ? WHERE key = ?", (now, digest))
+			value = pickle.loads(zlib.decompress(row[2]))
+		except (sqlite3.Error, pickle.UnpicklingError, zlib.error, EOFError, AttributeError, ImportError) as e:
+			self._failed("get", e)
+			return default
+		metrics.count("store.hit")
+		return value
+
+	def put(self, key, value):
+		digest = store_key(key, self.version)
+		now = time.time()
+		try:
+			payload = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+		except Exception as e:
+			self._failed("serialize", e)
+			return
+		try:
+			conn = self._connect()
+			conn.execute(
+				"INSERT OR REPLACE INTO results (key, version, created, accessed, size, payload) VALUES (?, ?, ?, ?, ?, ?)",
+				(digest, self.version, now, now, len(payload), payload),
+			)
+			if self._evict_due():
+				self._evict(conn, now)
+		except sqlite3.Error as e:
+			self._failed("put", e)
+
+	def _evict_due(self):
+		with self._writes_lock:
+			due = self._writes % EVICT_EVERY_WRITES == 0
+			self._writes += 1
+		return due
+
+	def _evict(self, conn, now):
+		expired = conn.execute("DELETE FROM results WHERE created < ?", (now - self.ttl,)).rowcount
+		(total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()
+		evicted = 0
+		if total > self.max_bytes:
+			target = self.max_bytes * STORE_LOW_WATER
+			conn.execute("BEGIN IMMEDIATE")
+			try:
+				rows = conn.execute(
+					"SELECT key, size FROM results ORDER BY version = ?, accessed", (self.version,)
+				).fetchall()
+				for row_key, size in rows:
+					if total <= target:
+						break
+					conn.execute("DELETE FROM results WHERE key = ?", (row_key,))
+					total -= size
+					evicted += 1
+				conn.execute("COMMIT")
+			except BaseException:
+				conn.execute("ROLLBACK")
+				raise
+		if expired or evicted:
+			metrics.count("store.evicted", expired + evicted)
+
+	def clear(self):
+		try:
+			self._connect().execute("DELETE FROM results")
+		except sqlite3.Error as e:
+			self._failed("clear", e)
+
+	def __len__(self):
+		try:
+			return self._connect().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+		except sqlite3.Error as e:
+			self._failed("len", e)
+			return 0
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_result_store():
+	"""Almacén compartido del proceso en STORE_PATH, o None si INTEGRALES_RESULT_STORE está vacía."""
+	global _store
+	with _store_lock:
+		if _store is None and STORE_PATH:
+			_store = ResultStore()
+		return _store
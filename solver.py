@@ -0,0 +1,1395 @@
+"""
+Motor de resolución de integrales propias e impropias.
+
+No depende de Streamlit: `solve_integral` devuelve un `IntegralResult` con
+todo lo necesario para mostrar el desarrollo paso a paso, de modo que el
+resultado se puede cachear, calcular en otros procesos o usar desde scripts.
+"""
+import dataclasses
+import hashlib
+import math
+import os
+import queue
+import signal
+import threading
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, CancelledError, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import sympy as sp
+from sympy import limit, oo, Symbol
+from sympy import re
+import mpmath as mp
+import numpy as np
+
+from compiled import clear_compiled, compiled
+from extrapolation import numeric_limit
+from quadrature import improper_test, integrand_scale, integrate as integrate_numeric
+from result_cache import ResultCache
+from workers import CANCEL_CHECK_SECONDS, WorkerCrashedError, get_pool, run_with_deadline
+
+
+def safe_float(val):
+	try:
+		val_real = re(val)
+		return float(sp.N(val_real, 15))
+	except Exception:
+		return None
+
+
+# Memo de find_singularities por (expresión, intervalo), compartido por el solver y la gráfica
+_singularities_cache = ResultCache(max_entries=512)
+
+# Funciones trigonométricas con polos donde se anula otra función de su argumento
+_TRIG_POLES = {sp.tan: sp.cos, sp.sec: sp.cos, sp.cot: sp.sin, sp.csc: sp.sin}
+
+
+def _bound_key(val):
+	"""
+	Extremo como parte de la clave del memo: float (±inf para ±oo) si es
+	numérico, para que 1 y 1.0 compartan entrada, y si no la expresión misma,
+	para que dos intervalos simbólicos distintos no la compartan.
+	"""
+	if val == oo:
+		return float("inf")
+	if val == -oo:
+		return float("-inf")
+	try:
+		return float(val)
+	except Exception:
+		pass
+	try:
+		return sp.sympify(val)
+	except Exception:
+		return val
+
+
+def _singularities_key(f, a_val, b_val, x):
+	return (f, _bound_key(a_val), _bound_key(b_val), x)
+
+
+def singularity_equations(f, x):
+	"""
+	Expresiones cuyos ceros marcan posibles singularidades de f, recorriendo
+	su árbol sin simplificar: bases con exponente negativo, radicandos de
+	raíces pares, argumentos de log y polos de tan/cot/sec/csc. Devuelve un
+	conjunto de pares (expresión, exponente): `exponente` es None, salvo en
+	las bases cuyo exponente depende de otro símbolo (un parámetro) y puede
+	ser negativo, que solo son singulares cuando lo es.
+	"""
+	equations = set()
+	for sub in sp.preorder_traversal(f):
+		if isinstance(sub, sp.Pow) and sub.base.has(x):
+			exp = sub.exp
+			if exp.is_negative or (exp.is_Rational and exp.q % 2 == 0):
+				equations.add((sub.base, None))
+			elif exp.free_symbols and not exp.has(x) and exp.is_nonnegative is not True:
+				equations.add((sub.base, exp))
+		elif isinstance(sub, sp.log) and sub.args[0].has(x):
+			equations.add((sub.args[0], None))
+		elif type(sub) in _TRIG_POLES and sub.args[0].has(x):
+			equations.add((_TRIG_POLES[type(sub)](sub.args[0]), None))
+	return equations
+
+
+def _structural_candidates(f, x, domain):
+	"""
+	Resuelve en `domain` las ecuaciones de singularity_equations. Devuelve
+	(candidatos, concluyente).
+	"""
+	candidates = set()
+	for expr in {expr for expr, _ in singularity_equations(f, x)}:
+		try:
+			sols = sp.solveset(sp.Eq(expr, 0), x, domain=domain)
+		except Exception:
+			return candidates, False
+		if sols is sp.S.EmptySet:
+			continue
+		if not isinstance(sols, sp.FiniteSet):
+			return candidates, False
+		candidates.update(s for s in sols if s.is_real is not False)
+	return candidates, True
+
+
+def _singularities_by_simplification(f, x, domain):
+	"""Detección completa (más lenta) sobre sp.simplify(f)."""
+	sing_set = set()
+
+	try:
+		f = sp.simplify(f)
+	except Exception:
+		return sing_set
+
+	# 1) Detectar ceros del denominador (polos)
+	try:
+		denom = sp.denom(f)
+		if denom != 1:
+			sols = sp.solveset(sp.Eq(denom, 0), x, domain=domain)
+			for s in sols:
+				try:
+					if s.is_real:
+						sing_set.add(sp.simplify(s))
+				except Exception:
+					pass
+	except Exception:
+		pass
+
+	# 2) Detectar raíces de radicandos con exponente par
+	try:
+		for sub in sp.preorder_traversal(f):
+			if isinstance(sub, sp.Pow):
+				exp = sub.args[1]
+				base = sub.args[0]
+				if exp.is_Rational and exp.q % 2 == 0:
+					sols = sp.solveset(sp.Eq(base, 0), x, domain=domain)
+					for s in sols:
+						sing_set.add(sp.simplify(s))
+	except Exception:
+		pass
+
+	# 3) NUEVO: Detectar discontinuidades en funciones como tan, 1/x, etc.
+	try:
+		for sub in sp.preorder_traversal(f):
+			if isinstance(sub, sp.tan):
+				arg = sub.args[0]
+				if sp.denom(arg) != 1:
+					denom_arg = sp.denom(arg)
+					sols = sp.solveset(sp.Eq(denom_arg, 0), x, domain=domain)
+					for s in sols:
+						try:
+							if s.is_real:
+								sing_set.add(sp.simplify(s))
+						except:
+							pass
+			if isinstance(sub, sp.exp):
+				arg = sub.args[0]
+				if sp.denom(arg) != 1:
+					denom_arg = sp.denom(arg)
+					sols = sp.solveset(sp.Eq(denom_arg, 0), x, domain=domain)
+					for s in sols:
+						try:
+							if s.is_real:
+								sing_set.add(sp.simplify(s))
+						except:
+							pass
+	except Exception:
+		pass
+
+	return sing_set
+
+
+def find_singularities(f, a_val, b_val, x):
+	"""
+	Intenta encontrar puntos de singularidad reales dentro del intervalo (a, b)
+	o en los límites (a o b). Devuelve una lista de singularidades encontradas.
+	Primero hace un análisis estructural rápido; solo si no es concluyente
+	recurre a sp.simplify. El resultado queda memorizado por (f, a, b).
+	"""
+	key = _singularities_key(f, a_val, b_val, x)
+	cached = _singularities_cache.get(key)
+	if cached is not None:
+		return list(cached)
+
+	a, b = key[1], key[2]
+	domain = sp.S.Reals
+	if a is not None and b is not None and a != float("-inf") and b != float("inf") and a <= b:
+		domain = sp.Interval(sp.nsimplify(a_val), sp.nsimplify(b_val))
+
+	try:
+		sing_set, conclusive = _structural_candidates(f, x, domain)
+	except Exception:
+		sing_set, conclusive = set(), False
+	if not conclusive:
+		sing_set |= _singularities_by_simplification(f, x, domain)
+
+	# Filtrar por el intervalo
+	filtered = []
+	for s in sing_set:
+		try:
+			sval = float(s)
+			if (a is None or sval >= a) and (b is None or sval <= b):
+				filtered.append(sp.simplify(s))
+		except Exception:
+			filtered.append(sp.simplify(s))
+
+	unique = sorted(list(set(filtered)), key=lambda z: float(z) if getattr(z, "is_number", False) else 0)
+	_singularities_cache.put(key, tuple(unique))
+	return unique
+
+
+def clear_caches():
+	"""Vacía los memos del solver y la caché interna de SymPy (p. ej. para medir en frío)."""
+	_singularities_cache.clear()
+	_antiderivative_cache.clear()
+	clear_compiled()
+	sp.core.cache.clear_cache()
+
+
+def remember_singularities(f, a_val, b_val, x, singularities):
+	"""Guarda en el memo singularidades ya calculadas (p. ej. por un proceso trabajador)."""
+	_singularities_cache.put(_singularities_key(f, a_val, b_val, x), tuple(singularities))
+
+
+def known_singularities(f, a_val, b_val, x):
+	"""Singularidades ya guardadas en el memo para (f, a, b), o None si no se han calculado."""
+	cached = _singularities_cache.get(_singularities_key(f, a_val, b_val, x))
+	return None if cached is None else list(cached)
+
+
+def _is_improper_point(value, singulars):
+	if value in (oo, -oo):
+		return True
+	return any(float(s) == float(value) for s in singulars)
+
+
+def partition_interval(f, a_val, b_val, x, singulars=None):
+	"""
+	Divide [a, b] en tramos con un solo extremo impropio cada uno: se corta
+	en cada singularidad y, entre dos extremos impropios seguidos, también
+	en un punto regular intermedio. Devuelve una lista de (inicio, fin,
+	extremo impropio) como _improper_parts, con extremo "lower", "upper" o
+	None si el tramo es propio.
+	"""
+	if singulars is None:
+		singulars = find_singularities(f, a_val, b_val, x)
+	interior = sorted((s for s in singulars if not _is_improper_point(s, [a_val, b_val])), key=float)
+	breaks = [a_val] + interior + [b_val]
+	pieces = []
+	for lo, hi in zip(breaks, breaks[1:]):
+		lo_improper, hi_improper = _is_improper_point(lo, singulars), _is_improper_point(hi, singulars)
+		if lo_improper and hi_improper:
+			if lo == -oo and hi == oo:
+				mid = sp.Integer(0)
+			elif lo == -oo:
+				mid = hi - 1
+			elif hi == oo:
+				mid = lo + 1
+			else:
+				mid = (lo + hi) / 2
+			pieces += [(lo, mid, "lower"), (mid, hi, "upper")]
+		else:
+			pieces.append((lo, hi, "lower" if lo_improper else "upper" if hi_improper else None))
+	return pieces
+
+
+def _needs_partition(a_val, b_val, singulars):
+	"""True si hay más de un extremo impropio que separar (varias singularidades, o una y un límite infinito)."""
+	try:
+		[float(s) for s in singulars]
+	except (TypeError, ValueError):
+		return False
+	if a_val in (oo, -oo) or b_val in (oo, -oo):
+		return len(singulars) > 0
+	return len(singulars) > 1
+
+
+def check_for_singularities_mode(f, a_val, b_val, x):
+	"""
+	Modo de resolución de la integral y, si hay una sola singularidad, su
+	punto c. Con varios extremos impropios (ver _needs_partition) el modo es
+	"partitioned" y el intervalo se divide con partition_interval.
+	"""
+	singulars = find_singularities(f, a_val, b_val, x)
+	if _needs_partition(a_val, b_val, singulars):
+		return "partitioned", None
+
+	if a_val == -oo and b_val == oo:
+		return "infinite_both", None
+	if b_val == oo:
+		return "infinite_upper", None
+	if a_val == -oo:
+		return "infinite_lower", None
+
+	if len(singulars) == 0:
+		return "proper", None
+	
+	if len(singulars) > 1:
+		try:
+			if getattr(a_val, "is_number", False) and getattr(b_val, "is_number", False):
+				center = (float(a_val) + float(b_val)) / 2
+				singulars = sorted(singulars, key=lambda s: abs(float(s) - center))
+		except:
+			pass
+
+	for s in singulars:
+		try:
+			if s == a_val:
+				return "singular_lower", s
+			if s == b_val:
+				return "singular_upper", s
+			if getattr(a_val, "is_number", False) and getattr(b_val, "is_number", False):
+				if float(a_val) < float(s) < float(b_val):
+					return "internal_singular", s
+		except Exception:
+			try:
+				if sp.Lt(a_val, s) and sp.Lt(s, b_val):
+					return "internal_singular", s
+			except Exception:
+				pass
+
+	return "internal_singular", singulars[0] if singulars else None
+
+
+def clean_divergence_result(result):
+	if result is oo:
+		return oo
+	if result is -oo:
+		return -oo
+	
+	try:
+		result_str = str(result)
+		if '(-1)' in result_str and '**' in result_str:
+			try:
+				result_numeric = complex(sp.N(result, 15))
+				if abs(result_numeric.imag) < 1e-10:
+					result = sp.Float(result_numeric.real)
+			except:
+				pass
+	except:
+		pass
+	
+	try:
+		if getattr(result, "is_infinite", False):
+			s = str(result)
+			if s.startswith('-'):
+				return -oo
+			return oo
+	except Exception:
+		pass
+	
+	if result is sp.nan:
+		return sp.nan
+	
+	return result
+
+
+def safe_limit(expr, var_sym, point, dir=None):
+	"""
+	Calcula límites de forma segura con múltiples estrategias. None si ni
+	SymPy ni la estimación numérica llegan a una conclusión.
+	"""
+	try:
+		if dir is None:
+			result = limit(expr, var_sym, point)
+		else:
+			result = limit(expr, var_sym, point, dir=dir)
+		
+		if result is sp.nan or result is sp.zoo:
+			raise ValueError("Límite indefinido")
+		
+		try:
+			result_numeric = complex(sp.N(result, 15))
+			if abs(result_numeric.imag) < 1e-10:
+				result = sp.Float(result_numeric.real)
+		except:
+			pass
+			
+		return result
+	except Exception:
+		# Respaldo numérico: sucesión geométrica de puntos + extrapolación (ver extrapolation.py).
+		# Devuelve siempre tipos de mpmath para que se distinga del límite simbólico.
+		estimate = numeric_limit(expr, var_sym, point, dir)
+		if estimate.verdict == "converge":
+			return mp.mpf(estimate.value)
+		if estimate.verdict == "diverge":
+			if estimate.value == oo:
+				return mp.inf
+			if estimate.value == -oo:
+				return -mp.inf
+			return mp.nan
+		return None
+
+
+def numeric_integral_backup(f_sym, a_val, b_val, x_sym):
+	"""
+	Integral numérica de f entre a y b: regla de doble exponencial en
+	float64 y, si no alcanza la tolerancia, mpmath (ver quadrature.integrate).
+	"""
+	try:
+		quad = integrate_numeric(f_sym, a_val, b_val, x_sym)
+	except Exception:
+		return (None, False)
+	if quad is None:
+		return (None, False)
+	return (quad.value, True)
+
+
+
+# Módulos cuyo código determina los resultados del solver
+ENGINE_MODULES = ("solver.py", "quadrature.py", "extrapolation.py", "compiled.py")
+
+
+@lru_cache(maxsize=None)
+def solver_version():
+	"""
+	Huella del motor: código de ENGINE_MODULES y versiones de SymPy, mpmath
+	y numpy. Un resultado guardado con otra huella se vuelve a calcular.
+	"""
+	digest = hashlib.sha256()
+	here = os.path.dirname(os.path.abspath(__file__))
+	for name in ENGINE_MODULES:
+		with open(os.path.join(here, name), "rb") as handle:
+			digest.update(handle.read())
+	digest.update(f"sympy={sp.__version__};mpmath={mp.__version__};numpy={np.__version__}".encode())
+	return digest.hexdigest()[:16]
+
+
+# Tiempos máximos (segundos) de los cálculos simbólicos
+ANTIDERIVATIVE_TIMEOUT = 10
+# Plazo de la prueba asintótica en cada extremo impropio
+ASYMPTOTIC_TIMEOUT = 1
+# Plazos de la resolución completa en un proceso trabajador
+SOLVE_TIMEOUT = 40
+NUMERIC_TIMEOUT = 20
+# Error máximo del respaldo numérico, relativo a la escala del integrando, cuando la prueba de convergencia no es concluyente
+NUMERIC_ACCEPT_RTOL = 1e-6
+
+
+class InvalidInputError(ValueError):
+	"""Una de las entradas (f, a o b) no se pudo interpretar."""
+
+	def __init__(self, field, message):
+		super().__init__(message)
+		self.field = field
+
+
+@dataclass
+class LimitStep:
+	"""Un límite del desarrollo: lim_{var -> point^dir} [upper - lower] = value."""
+	var: object
+	point: object
+	dir: object
+	upper: object
+	lower: object
+	value: object
+	simplified: object = None
+	numeric: bool = False
+
+
+@dataclass
+class AsymptoticTest:
+	"""
+	Prueba asintótica en un extremo impropio `point` (extremo "upper" o
+	"lower" de su tramo): f ≈ `leading` cerca del extremo. `exponent` es el
+	q de la integral p con que se compara, 1/|x - c|^q (1/|x|^q en ±oo), o
+	None si se comparó en el límite con q = 1.
+	"""
+	point: object
+	end: str
+	leading: object
+	exponent: object
+	verdict: str
+	value: object = None
+
+
+@dataclass
+class IntegralResult:
+	"""
+	Resultado estructurado de una integral. `status` es "ok", "invalid_input",
+	"equal_limits", "timeout", "memory" o "error"; `verdict` es "converge",
+	"diverge" o None si no se pudo decidir. Con F_status "partial", F integra
+	solo parte de los términos de f y `residual` (la suma de los demás) se
+	integra numéricamente, con resultado `residual_value`. Con F_status
+	"skipped" la prueba asintótica (`asymptotic`) ya mostró la divergencia y
+	no se calculó la antiderivada. Con mode "partitioned" el intervalo se
+	divide en `pieces` (ver partition_interval) y `parts` guarda el
+	IntegralResult de cada tramo, o None si no se resolvió porque otro tramo
+	ya divergía. `peak_memory` es el pico de memoria residente (KiB) del
+	proceso trabajador que la resolvió, si se resolvió en uno.
+	"""
+	f: object = None
+	a: object = None
+	b: object = None
+	var: str = 'x'
+	status: str = "ok"
+	message: str = ""
+	details: str = ""
+	swapped: bool = False
+	domain_warning: bool = False
+	mode: str = None
+	c: object = None
+	singularities: list = field(default_factory=list)
+	F: object = None
+	F_status: str = None
+	residual: object = None
+	residual_value: object = None
+	asymptotic: list = field(default_factory=list)
+	pieces: list = field(default_factory=list)
+	parts: list = field(default_factory=list)
+	evaluation: tuple = None
+	limits: list = field(default_factory=list)
+	numeric_backup_used: bool = False
+	value: object = None
+	verdict: str = None
+	reason: str = None
+	timings: dict = field(default_factory=dict)
+	counters: dict = field(default_factory=dict)
+	peak_memory: int = None
+
+	@property
+	def converges(self):
+		return self.verdict == "converge"
+
+	@property
+	def hit_deadline(self):
+		"""
+		True si algún plazo se agotó por el camino (la resolución completa, la
+		vía simbólica o la antiderivada): el resultado depende de la carga del
+		momento, aunque su status sea "ok".
+		"""
+		return (self.status == "timeout" or self.F_status == "timeout"
+			or any(self.counters.get(name) for name in ("symbolic_timeout", "antiderivative_timeout")))
+
+	def summary(self):
+		"""Resumen serializable a JSON (sin objetos de SymPy)."""
+		value = safe_float(self.value) if self.value is not None else None
+		if value is not None and not math.isfinite(value):
+			value = None
+		if value is None and self.value is not None:
+			value = str(self.value)
+		return {
+			"status": self.status,
+			"mode": self.mode,
+			"singularity": None if self.c is None else str(self.c),
+			"antiderivative": None if self.F is None else str(self.F),
+			"value": value,
+			"verdict": self.verdict,
+			"converges": None if self.verdict is None else self.converges,
+			"numeric_backup_used": self.numeric_backup_used,
+			"message": self.message or None,
+		}
+
+
+def _count(result, name, n=1):
+	"""Suma n al contador `name` del resultado (respaldos, plazos agotados...)."""
+	if n:
+		result.counters[name] = result.counters.get(name, 0) + n
+
+
+@contextmanager
+def _phase(result, name):
+	"""Acumula en result.timings[name] los segundos que tarda el bloque."""
+	start = time.perf_counter()
+	try:
+		yield
+	finally:
+		result.timings[name] = result.timings.get(name, 0.0) + time.perf_counter() - start
+
+
+@contextmanager
+def _time_limit(seconds):
+	"""
+	Lanza TimeoutError si el bloque tarda más de `seconds`. Solo funciona en
+	el hilo principal en Unix, como dentro de un proceso trabajador.
+	"""
+	def timeout_handler(signum, frame):
+		raise TimeoutError("Cálculo tardó demasiado")
+
+	try:
+		signal.signal(signal.SIGALRM, timeout_handler)
+		signal.alarm(seconds)
+	except Exception:
+		pass
+	try:
+		yield
+	finally:
+		try:
+			signal.alarm(0)
+		except Exception:
+			pass
+
+
+# Antiderivadas de los términos normalizados (sin factor constante), por proceso
+_antiderivative_cache = ResultCache(max_entries=1024)
+
+
+def split_terms(f, x):
+	"""
+	Descompone f en [(coeficiente, término), ...] con f = Σ coeficiente·término:
+	se separan los sumandos (también dentro de un factor constante, como en
+	3*(x + exp(-x))) y se saca de cada uno su factor constante. Los términos
+	iguales se agrupan, así que cada uno aparece una sola vez.
+	"""
+	terms = {}
+
+	def visit(expr, coeff):
+		factor, rest = expr.as_independent(x, as_Add=False)
+		if rest.is_Add:
+			for arg in rest.args:
+				visit(arg, coeff * factor)
+		else:
+			terms[rest] = terms.get(rest, sp.Integer(0)) + coeff * factor
+
+	visit(f, sp.Integer(1))
+	return [(coeff, term) for term, coeff in terms.items() if coeff != 0]
+
+
+def _term_antiderivative(term, x, seconds):
+	"""("ok", F), ("failed", None) o ("timeout", segundos) para un término normalizado."""
+	try:
+		with _time_limit(seconds):
+			F = sp.integrate(term, x)
+	except TimeoutError:
+		return ("timeout", seconds)
+	except MemoryError:
+		# Agotó el presupuesto de memoria del trabajador: no es un fallo que memorizar
+		raise
+	except Exception:
+		return ("failed", None)
+	if F.has(sp.Integral):
+		# SymPy devolvió la integral sin evaluar
+		return ("failed", None)
+	return ("ok", F)
+
+
+def termwise_antiderivative(f, x, timeout=ANTIDERIVATIVE_TIMEOUT, result=None):
+	"""
+	Antiderivada de f integrando cada término de split_terms por separado.
+	Devuelve (F, resto, estado): F integra los términos que SymPy resolvió
+	(None si ninguno) y `resto` es la suma de los demás (None si no queda
+	ninguno); `estado` es "ok", "partial", "timeout" o "failed".
+
+	Cada término se integra una sola vez por proceso: los resultados y los
+	fallos se recuerdan, así que otra integral que comparta términos solo
+	calcula los nuevos. Los plazos agotados no se recuerdan: el plazo
+	depende de la carga del momento y el término se vuelve a intentar. El
+	plazo `timeout` se reparte entre los términos pendientes y lo que no
+	gasta uno pasa a los siguientes.
+	"""
+	deadline = time.monotonic() + timeout
+	terms = split_terms(f, x)
+	solved, residual, timed_out = [], [], False
+	for index, (coeff, term) in enumerate(terms):
+		seconds = max(1, int((deadline - time.monotonic()) / (len(terms) - index)))
+		entry = _antiderivative_cache.get((term, x))
+		if entry is None:
+			if result is not None:
+				_count(result, "term_cache_miss")
+			entry = _term_antiderivative(term, x, seconds)
+			if entry[0] != "timeout":
+				_antiderivative_cache.put((term, x), entry)
+		elif result is not None:
+			_count(result, "term_cache_hit")
+		status, F_term = entry
+		if status == "ok":
+			solved.append(coeff * F_term)
+		else:
+			residual.append(coeff * term)
+			timed_out = timed_out or status == "timeout"
+	if not residual:
+		return sp.Add(*solved), None, "ok"
+	if not solved:
+		return None, None, "timeout" if timed_out else "failed"
+	return sp.Add(*solved), sp.Add(*residual), "partial"
+
+
+def parse_integral(f_str, a_str, b_str):
+	"""Convierte las entradas de texto en expresiones SymPy (f, a, b)."""
+	f_str_sympify = f_str.replace('E', 'exp(1)')
+	try:
+		f = sp.sympify(f_str_sympify)
+	except Exception as e:
+		raise InvalidInputError("f", f"Entrada inválida para f(x): {e}. Ejemplos válidos: x**2, 1/x**2, sqrt(x), exp(x), log(x).")
+	try:
+		a = sp.sympify(a_str)
+	except Exception:
+		raise InvalidInputError("a", "Entrada inválida para límite inferior 'a'. Usa números o 'oo'/'-oo'.")
+	try:
+		b = sp.sympify(b_str)
+	except Exception:
+		raise InvalidInputError("b", "Entrada inválida para límite superior 'b'. Usa números o 'oo'/'-oo'.")
+	return f, a, b
+
+
+def canonical_key(f_str, a_str, b_str):
+	"""
+	Clave canónica (f, a, b) de la integral ya parseada por SymPy, o None si
+	alguna entrada no se puede interpretar. Dos formas de escribir la misma
+	expresión comparten clave.
+	"""
+	try:
+		f, a, b = parse_integral(f_str, a_str, b_str)
+	except InvalidInputError:
+		return None
+	return (sp.srepr(f), sp.srepr(a), sp.srepr(b))
+
+
+def is_divergent_value(value):
+	"""True si el valor de un límite es infinito, indefinido u oscila (AccumBounds)."""
+	if value is None:
+		return False
+	if isinstance(value, sp.AccumBounds):
+		return True
+	if value in [sp.oo, -sp.oo] or str(value).lower() in ['oo', '-oo', 'zoo', 'infinity', 'inf', '-inf']:
+		return True
+	return value is sp.nan or str(value).lower() == 'nan'
+
+
+def is_unresolved_value(value):
+	"""
+	True si SymPy dejó el valor a medias: contiene un Limit sin evaluar o un
+	AccumBounds dentro de otra expresión (p. ej. oo*sign(AccumBounds(-1, 1))).
+	"""
+	if value is None or isinstance(value, sp.AccumBounds):
+		return False
+	return isinstance(value, sp.Basic) and value.has(sp.Limit, sp.AccumBounds)
+
+
+def _limit_step(var, point, dir, upper, lower, simplify=True):
+	expr = upper - lower
+	value = clean_divergence_result(safe_limit(expr, var, point, dir=dir))
+	# safe_limit devuelve un mpf cuando SymPy falló y se estimó numéricamente,
+	# y None si tampoco la estimación fue concluyente
+	numeric = isinstance(value, (mp.mpf, mp.mpc))
+	if numeric:
+		value = sp.sympify(value)
+	return LimitStep(var, point, dir, upper, lower, value, sp.simplify(expr) if simplify else None, numeric)
+
+
+def _endpoint_value(F, x, point, dir):
+	"""F(point); si no es finito (p. ej. x*log(x) en 0) se usa el límite lateral."""
+	value = F.subs(x, point)
+	if value.is_finite is not True:
+		limit_value = safe_limit(F, x, point, dir=dir)
+		if isinstance(limit_value, (mp.mpf, mp.mpc)):
+			limit_value = sp.sympify(limit_value)
+		value = limit_value
+	return value
+
+
+def _proper_difference(F_b, F_a):
+	"""F(b) - F(a), o None si algún extremo quedó sin evaluar."""
+	if F_b is None or F_a is None:
+		return None
+	return sp.simplify(F_b - F_a)
+
+
+def _numeric_value(f, a, b, x, require_accuracy=False):
+	"""
+	Valor numérico de la integral. Con `require_accuracy` se descarta si el
+	error estimado supera NUMERIC_ACCEPT_RTOL veces la escala del integrando
+	muestreado (p. ej. cuando mp.quad no converge y devolvería un número sin
+	sentido, cuyo error relativo a sí mismo parecería pequeño).
+	"""
+	try:
+		quad = integrate_numeric(f, a, b, x)
+	except Exception:
+		return None
+	if quad is None:
+		return None
+	if require_accuracy and not quad.error <= NUMERIC_ACCEPT_RTOL * max(1.0, integrand_scale(f, a, b, x)):
+		return None
+	return sp.sympify(quad.value)
+
+
+def _numeric_near_singularity(f, a_num, b_num, x, side, require_accuracy=False):
+	"""
+	Integral con un extremo singular ("lower" o "upper"). La cuadratura no
+	evalúa f en los extremos; si falla, se integra con mpmath separándose
+	`delta` del extremo singular.
+	"""
+	value = _numeric_value(f, a_num, b_num, x, require_accuracy)
+	if value is not None or require_accuracy:
+		return value
+	try:
+		f_mp = compiled(f, x, 'mpmath')
+	except Exception:
+		return None
+	for delta in [1e-6, 1e-4, 1e-2]:
+		try:
+			if side == "lower":
+				val = mp.quad(f_mp, [a_num + delta, b_num])
+			else:
+				val = mp.quad(f_mp, [a_num, b_num - delta])
+			return sp.sympify(val)
+		except Exception:
+			continue
+	return None
+
+
+def _has_even_root_domain_issue(f, a, x):
+	"""True si f tiene una raíz de índice par cuyo radicando es negativo en a < 0."""
+	for sub in sp.preorder_traversal(f):
+		if isinstance(sub, sp.Pow):
+			exp = sub.args[1]
+			base = sub.args[0]
+			if exp.is_Rational and exp.q % 2 == 0:
+				if a != -oo and a.is_number and float(a) < 0:
+					try:
+						test_val = base.subs(x, a)
+						if test_val.is_number and float(test_val) < 0:
+							return True
+					except Exception:
+						pass
+	return False
+
+
+def _set_verdict(result, value):
+	value = clean_divergence_result(value) if value is not None else None
+	if is_unresolved_value(value):
+		value = None
+	result.value = value
+	if value is None:
+		result.verdict = None
+	elif is_divergent_value(value):
+		result.verdict = "diverge"
+		if isinstance(value, sp.AccumBounds):
+			result.reason = "oscillating"
+		elif value is sp.nan or str(value).lower() == 'nan':
+			result.reason = "undefined"
+		else:
+			result.reason = "infinite"
+	else:
+		result.verdict = "converge"
+
+
+def _set_parts_verdict(result):
+	parts = [step.value for step in result.limits]
+	divergent = [p for p in parts if is_divergent_value(p)]
+	if divergent:
+		_set_verdict(result, divergent[0])
+	elif any(safe_float(p) is None for p in parts):
+		result.value = sp.nan
+		result.verdict = "diverge"
+		result.reason = "missing"
+	else:
+		result.value = sum(parts, sp.Integer(0))
+		result.verdict = "converge"
+
+
+def solve_integral(f_str, a_str, b_str, var='x'):
+	"""Parsea las entradas de texto y resuelve la integral. Nunca lanza excepciones."""
+	start = time.perf_counter()
+	try:
+		f, a, b = parse_integral(f_str, a_str, b_str)
+	except InvalidInputError as e:
+		return IntegralResult(var=var, status="invalid_input", message=str(e), details=e.field)
+	parse_seconds = time.perf_counter() - start
+	result = solve_parsed(f, a, b, var)
+	result.timings = {"parse": parse_seconds, **result.timings}
+	return result
+
+
+def solve_parsed(f, a, b, var='x', symbolic=True, on_progress=None, solve_parts=True):
+	"""
+	Resuelve la integral de f entre a y b (ya parseados) y devuelve un
+	IntegralResult. Con symbolic=False se omite la antiderivada y se usa
+	directamente la evaluación numérica de respaldo. Si se da `on_progress`,
+	se llama con (paso, resultado parcial) al terminar cada paso intermedio
+	("classify" y "antiderivative"). Con solve_parts=False, una integral con
+	modo "partitioned" se devuelve sin veredicto tras clasificarla, para que
+	quien llama resuelva los tramos (ver solve_hybrid).
+	"""
+	result = IntegralResult(f=f, a=a, b=b, var=var)
+	try:
+		_solve(result, symbolic, on_progress, solve_parts)
+	except TimeoutError:
+		result.status = "timeout"
+	except MemoryError:
+		result.status = "memory"
+	except Exception as e:
+		result.status = "error"
+		result.message = str(e)
+		result.details = traceback.format_exc()
+	return result
+
+
+def solve_isolated(f, a, b, var='x', pool=None, timeout=None, cancel_event=None):
+	"""
+	Igual que solve_parsed pero en un proceso trabajador con plazo real
+	(`timeout`, por defecto SOLVE_TIMEOUT). Si la vía simbólica lo supera, el
+	trabajador se mata y se reemplaza, y se repite la resolución solo con la
+	vía numérica; lo mismo si agota su presupuesto de memoria (ver
+	workers.TASK_MEMORY_BUDGET_MB). Sin `pool` se usa el pool compartido del
+	proceso. Si se activa `cancel_event` se lanza
+	concurrent.futures.CancelledError.
+	"""
+	run = pool.run if pool is not None else run_with_deadline
+	memory = {}
+	try:
+		result = run(
+			solve_parsed, f, a, b, var, timeout=timeout or SOLVE_TIMEOUT, cancel_event=cancel_event,
+			on_memory=lambda kib: memory.update(symbolic=kib),
+		)
+		result.peak_memory = memory.get("symbolic")
+		if result.status != "memory":
+			return result
+	except (TimeoutError, WorkerCrashedError):
+		result = None
+	try:
+		numeric = run(
+			solve_parsed, f, a, b, var, symbolic=False, timeout=NUMERIC_TIMEOUT, cancel_event=cancel_event,
+			on_memory=lambda kib: memory.update(numeric=kib),
+		)
+	except (TimeoutError, WorkerCrashedError):
+		return result or IntegralResult(f=f, a=a, b=b, var=var, status="timeout")
+	numeric.peak_memory = memory.get("numeric")
+	_count(numeric, "symbolic_timeout" if result is None else "symbolic_memory")
+	return numeric
+
+
+def _future_result(future):
+	try:
+		return future.result()
+	except (TimeoutError, WorkerCrashedError):
+		return None
+
+
+def solve_hybrid(f, a, b, var='x', on_numeric=None, on_progress=None, cancel_event=None):
+	"""
+	Lanza a la vez la vía simbólica completa y la vía solo numérica en
+	procesos trabajadores. Si la numérica termina primero, su resultado se
+	pasa a `on_numeric` como avance y se sigue esperando a SymPy hasta
+	SOLVE_TIMEOUT; si SymPy no termina a tiempo o se queda sin memoria, se
+	devuelve el numérico.
+	Los pasos intermedios de la vía simbólica se pasan a `on_progress`
+	(como en solve_parsed). Ambas devoluciones de llamada se ejecutan en el
+	hilo que llama a solve_hybrid. Si se activa `cancel_event`, las dos vías
+	se detienen y se lanza concurrent.futures.CancelledError. Si la integral
+	se divide en tramos, el trabajador simbólico solo la clasifica y los
+	tramos se resuelven en paralelo (ver _solve_parts_parallel).
+	"""
+	pool = get_pool()
+	events = queue.Queue()
+	memory = {}
+	symbolic = pool.submit(
+		solve_parsed, f, a, b, var, solve_parts=False, timeout=SOLVE_TIMEOUT,
+		on_progress=(lambda *event: events.put(event)) if on_progress is not None else None,
+		cancel_event=cancel_event, on_memory=lambda kib: memory.update(symbolic=kib),
+	)
+	# La vía numérica tiene su propio evento: pool.submit(...).cancel() no
+	# detiene una tarea que ya se está ejecutando
+	numeric_stop = threading.Event()
+	numeric = pool.submit(
+		solve_parsed, f, a, b, var, symbolic=False, timeout=NUMERIC_TIMEOUT, cancel_event=numeric_stop,
+		on_memory=lambda kib: memory.update(numeric=kib),
+	)
+
+	def relay_progress():
+		while on_progress is not None:
+			try:
+				on_progress(*events.get_nowait())
+			except queue.Empty:
+				return
+
+	def forward_cancel():
+		if cancel_event is not None and cancel_event.is_set():
+			numeric_stop.set()
+
+	try:
+		numeric_reported = False
+		while not symbolic.done():
+			# Con la numérica ya terminada solo se espera a SymPy (si no, wait
+			# volvería al instante en cada vuelta)
+			wait([symbolic] if numeric.done() else [symbolic, numeric], timeout=0.1, return_when=FIRST_COMPLETED)
+			forward_cancel()
+			relay_progress()
+			if numeric.done() and not symbolic.done() and not numeric_reported:
+				numeric_reported = True
+				numeric_result = _future_result(numeric)
+				if numeric_result is not None and on_numeric is not None:
+					on_numeric(numeric_result)
+		relay_progress()
+
+		result = _future_result(symbolic)
+		if result is not None and result.status != "memory":
+			numeric_stop.set()
+			result.peak_memory = memory.get("symbolic")
+			if result.status == "ok" and result.mode == "partitioned" and result.verdict is None:
+				# El trabajador solo clasificó la integral y dejó los tramos sin resolver
+				_solve_parts_parallel(result, pool, cancel_event, on_progress)
+			return result
+		# SymPy agotó el plazo o su presupuesto de memoria: vale el resultado numérico
+		while not numeric.done():
+			wait([numeric], timeout=CANCEL_CHECK_SECONDS)
+			forward_cancel()
+		fallback = _future_result(numeric)
+		if fallback is not None:
+			fallback.peak_memory = memory.get("numeric")
+			_count(fallback, "symbolic_timeout" if result is None else "symbolic_memory")
+			return fallback
+		if result is not None:
+			result.peak_memory = memory.get("symbolic")
+		return result or IntegralResult(f=f, a=a, b=b, var=var, status="timeout")
+	finally:
+		numeric_stop.set()
+
+
+def _solve_parts_parallel(result, pool, cancel_event=None, on_progress=None):
+	"""
+	Resuelve a la vez cada tramo de una integral "partitioned", cada uno en
+	su proceso trabajador (con plazo y respaldo numérico, ver
+	solve_isolated). En cuanto un tramo diverge se cancelan los que faltan:
+	la integral completa ya diverge. Tras cada tramo terminado se llama a
+	`on_progress("parts", resultado parcial)`.
+	"""
+	stop = threading.Event()
+	parts = [None] * len(result.pieces)
+	with _phase(result, "parts"), ThreadPoolExecutor(max_workers=len(result.pieces), thread_name_prefix="solve-part") as executor:
+		futures = {
+			executor.submit(solve_isolated, result.f, lo, hi, result.var, pool, cancel_event=stop): i
+			for i, (lo, hi, _) in enumerate(result.pieces)
+		}
+		pending = set(futures)
+		while pending:
+			done, pending = wait(pending, timeout=CANCEL_CHECK_SECONDS, return_when=FIRST_COMPLETED)
+			if cancel_event is not None and cancel_event.is_set():
+				stop.set()
+			for future in done:
+				try:
+					parts[futures[future]] = part = future.result()
+				except CancelledError:
+					continue
+				if part.verdict == "diverge":
+					stop.set()
+			if done and on_progress is not None and not stop.is_set():
+				on_progress("parts", dataclasses.replace(result, parts=list(parts)))
+	if cancel_event is not None and cancel_event.is_set():
+		raise CancelledError()
+	result.parts = parts
+	_set_pieces_verdict(result)
+
+
+def _solve_parts(result, symbolic=True):
+	"""Resuelve uno tras otro los tramos de una integral "partitioned", hasta el primero que diverge."""
+	result.parts = [None] * len(result.pieces)
+	with _phase(result, "parts"):
+		for i, (lo, hi, _) in enumerate(result.pieces):
+			result.parts[i] = part = solve_parsed(result.f, lo, hi, result.var, symbolic)
+			if part.verdict == "diverge":
+				break
+	_set_pieces_verdict(result)
+
+
+def _set_pieces_verdict(result):
+	"""La integral diverge si diverge algún tramo y converge a la suma si convergen todos."""
+	parts = [part for part in result.parts if part is not None]
+	for part in parts:
+		for name, n in part.counters.items():
+			_count(result, name, n)
+	result.numeric_backup_used = any(part.numeric_backup_used for part in parts)
+	peaks = [kib for kib in [result.peak_memory] + [part.peak_memory for part in parts] if kib is not None]
+	result.peak_memory = max(peaks, default=None)
+	divergent = [part for part in parts if part.verdict == "diverge"]
+	if divergent:
+		_count(result, "parts_skipped", len(result.parts) - len(parts))
+		_set_verdict(result, divergent[0].value)
+	elif len(parts) == len(result.pieces) and all(part.verdict == "converge" for part in parts):
+		_set_verdict(result, sum((part.value for part in parts), sp.Integer(0)))
+	else:
+		_set_verdict(result, None)
+
+
+def _solve(result, symbolic=True, on_progress=None, solve_parts=True):
+	report = on_progress or (lambda step, partial: None)
+	f, a, b = result.f, result.a, result.b
+	x = Symbol(result.var)
+
+	# Validación básica de límites
+	if a == b:
+		result.status = "equal_limits"
+		_set_verdict(result, sp.Integer(0))
+		return
+
+	try:
+		if getattr(a, "is_number", False) and getattr(b, "is_number", False):
+			if float(a) > float(b):
+				a, b = b, a
+				result.a, result.b, result.swapped = a, b, True
+	except Exception:
+		pass
+
+	result.domain_warning = _has_even_root_domain_issue(f, a, x)
+
+	with _phase(result, "classify"):
+		mode, c = check_for_singularities_mode(f, a, b, x)
+		result.mode, result.c = mode, c
+		if not mode.startswith("infinite"):
+			result.singularities = find_singularities(f, a, b, x)
+		if mode == "partitioned":
+			result.pieces = partition_interval(f, a, b, x, result.singularities)
+	report("classify", result)
+
+	if symbolic and mode != "proper":
+		with _phase(result, "asymptotic"):
+			divergent = _asymptotic_precheck(result, x)
+		if divergent is not None:
+			result.F_status = "skipped"
+			_count(result, "asymptotic_divergence")
+			_set_verdict(result, divergent)
+			return
+
+	if mode == "partitioned":
+		if solve_parts:
+			_solve_parts(result, symbolic)
+		return
+
+	# Antiderivada término a término, con plazo
+	with _phase(result, "antiderivative"):
+		if symbolic:
+			F, residual, result.F_status = termwise_antiderivative(f, x, result=result)
+			result.F, result.residual = F, residual
+			if result.F_status == "timeout":
+				_count(result, "antiderivative_timeout")
+		else:
+			F = None
+			result.F_status = "timeout"
+			_count(result, "symbolic_skipped")
+	report("antiderivative", result)
+
+	if result.residual is not None:
+		if _evaluate_partial(result, F, x):
+			return
+		# Las dos partes divergen o alguna no se pudo evaluar: se integra f entera numéricamente
+		F = result.F = result.residual = None
+		result.F_status = "failed"
+		result.limits, result.evaluation = [], None
+
+	if F is not None:
+		with _phase(result, "limits"):
+			value = _evaluate_with_antiderivative(result, F, x)
+			_count(result, "limit_fallback", sum(step.numeric for step in result.limits))
+		if _limits_unresolved(result, value):
+			# SymPy no terminó de evaluar algún límite: decide la vía numérica
+			_count(result, "limits_unresolved")
+			result.limits, result.evaluation = [], None
+			F = None
+	if F is None:
+		with _phase(result, "numeric"):
+			value = _evaluate_numerically(result, x)
+			result.numeric_backup_used = value is not None
+			_count(result, "numeric_backup", int(result.numeric_backup_used))
+
+	if mode in ("internal_singular", "infinite_both") and result.limits:
+		_set_parts_verdict(result)
+		return
+
+	_set_verdict(result, value)
+
+
+def _limits_unresolved(result, value):
+	"""
+	True si el valor obtenido con F, o el de algún límite por partes, quedó
+	sin resolver o sin evaluar (None, ver safe_limit).
+	"""
+	if result.mode in ("internal_singular", "infinite_both") and result.limits:
+		return any(step.value is None or is_unresolved_value(step.value) for step in result.limits)
+	return value is None or is_unresolved_value(value)
+
+
+def _evaluate_partial(result, F, x):
+	"""
+	F integra solo parte de los términos: esa parte se evalúa con límites y
+	el resto (result.residual) numéricamente. Si las dos convergen el valor
+	es la suma, y si una diverge y la otra converge la integral diverge.
+	Devuelve False, sin veredicto, si las dos divergen (podrían cancelarse)
+	o alguna no se pudo evaluar.
+	"""
+	with _phase(result, "limits"):
+		value = _evaluate_with_antiderivative(result, F, x)
+		_count(result, "limit_fallback", sum(step.numeric for step in result.limits))
+	if _limits_unresolved(result, value):
+		return False
+	if result.mode in ("internal_singular", "infinite_both") and result.limits:
+		parts = [step.value for step in result.limits]
+		divergent = [p for p in parts if is_divergent_value(p)]
+		value = divergent[0] if divergent else sum(parts, sp.Integer(0))
+	with _phase(result, "numeric"):
+		residual_value = _evaluate_numerically(result, x, result.residual)
+	if value is None or residual_value is None:
+		return False
+	finite = [v for v in (value, residual_value) if not is_divergent_value(v) and safe_float(v) is not None]
+	if not finite:
+		return False
+	_count(result, "residual_numeric")
+	result.residual_value = residual_value
+	if len(finite) == 2:
+		_set_verdict(result, value + residual_value)
+	else:
+		_set_verdict(result, value if finite[0] is residual_value else residual_value)
+	return True
+
+
+def _evaluate_with_antiderivative(result, F, x):
+	"""Aplica F(b) - F(a) o los límites que correspondan al modo. Rellena result.limits."""
+	a, b, c, mode = result.a, result.b, result.c, result.mode
+	t = Symbol('t')
+	epsilon = Symbol('epsilon')
+	t1, t2 = Symbol('t1'), Symbol('t2')
+
+	if mode == "proper":
+		F_b = _endpoint_value(F, x, b, '-')
+		F_a = _endpoint_value(F, x, a, '+')
+		result.evaluation = (F_b, F_a)
+		return _proper_difference(F_b, F_a)
+	if mode == "infinite_upper":
+		result.limits.append(_limit_step(t, oo, None, F.subs(x, t), F.subs(x, a)))
+	elif mode == "infinite_lower":
+		result.limits.append(_limit_step(t, -oo, None, F.subs(x, b), F.subs(x, t)))
+	elif mode == "singular_lower":
+		result.limits.append(_limit_step(epsilon, a, '+', F.subs(x, b), F.subs(x, epsilon)))
+	elif mode == "singular_upper":
+		result.limits.append(_limit_step(epsilon, b, '-', F.subs(x, epsilon), F.subs(x, a)))
+	elif mode == "internal_singular":
+		c_val = c if c is not None else sp.Integer(0)
+		result.limits.append(_limit_step(t1, c_val, '-', F.subs(x, t1), F.subs(x, a), simplify=False))
+		result.limits.append(_limit_step(t2, c_val, '+', F.subs(x, b), F.subs(x, t2), simplify=False))
+		return None
+	elif mode == "infinite_both":
+		# Se divide en c = 0
+		result.limits.append(_limit_step(t1, -oo, None, F.subs(x, 0), F.subs(x, t1), simplify=False))
+		result.limits.append(_limit_step(t2, oo, None, F.subs(x, t2), F.subs(x, 0), simplify=False))
+		return None
+	return result.limits[0].value
+
+
+def _improper_parts(result):
+	"""Tramos (a, b, extremo impropio) en que se divide la integral según su modo."""
+	a, b, c, mode = result.a, result.b, result.c, result.mode
+	if mode == "partitioned":
+		return [piece for piece in result.pieces if piece[2] is not None]
+	if mode in ("infinite_upper", "singular_upper"):
+		return [(a, b, "upper")]
+	if mode in ("infinite_lower", "singular_lower"):
+		return [(a, b, "lower")]
+	if mode == "infinite_both":
+		return [(a, sp.Integer(0), "lower"), (sp.Integer(0), b, "upper")]
+	if mode == "internal_singular":
+		c_val = c if c is not None else sp.Integer(0)
+		return [(a, c_val, "upper"), (c_val, b, "lower")]
+	return []
+
+
+def _sign_infinity(value):
+	"""oo o -oo según el signo de la parte real de `value` (zoo si es imaginario puro)."""
+	real = sp.re(value)
+	if real.is_positive:
+		return oo
+	if real.is_negative:
+		return -oo
+	return sp.zoo
+
+
+def asymptotic_test(f, x, point, end):
+	"""
+	Decide en milisegundos si la integral de f converge cerca de un extremo
+	impropio sin calcular la antiderivada. Con u → 0⁺ la distancia al punto
+	(o 1/|x| en ±oo), se toma el término principal C·u^p·log(u)^k de f y se
+	aplica la regla de las integrales p. Si el término principal no tiene esa
+	forma, se compara en el límite con la integral p frontera: si f·u (o f·x
+	en ±oo) tiende a un valor no nulo o a infinito, la integral diverge.
+	Devuelve un AsymptoticTest o None si no se pudo decidir.
+	"""
+	u = sp.Dummy('u', positive=True)
+	if point == oo:
+		sub, back = 1 / u, 1 / x
+	elif point == -oo:
+		sub, back = -1 / u, -1 / x
+	elif end == "upper":
+		sub, back = point - u, point - x
+	else:
+		sub, back = point + u, x - point
+	at_infinity = point in (oo, -oo)
+	g = f.subs(x, sub)
+
+	try:
+		lead = g.as_leading_term(u)
+		coeff, dependent = lead.as_independent(u, as_Add=False)
+		powers = dict(dependent.as_powers_dict())
+		powers.pop(sp.Integer(1), None)
+		# f ≈ C·u^p·log(u)^k, es decir C·log(u)^k / |x - c|^q (o / |x|^q en ±oo)
+		p = powers.pop(u, sp.Integer(0))
+		k = powers.pop(sp.log(u), sp.Integer(0))
+		q = p if at_infinity else -p
+		if not powers and coeff.is_number and not coeff.has(sp.AccumBounds) and coeff.is_finite and coeff != 0 \
+				and q.is_real and k.is_integer:
+			if q == 1:
+				converges = k < -1
+			else:
+				converges = q > 1 if at_infinity else q < 1
+			leading = sp.expand_log(lead.subs(u, back), force=True)
+			if converges:
+				return AsymptoticTest(point, end, leading, q, "converge")
+			# Cerca del extremo log(u) < 0, así que el signo de f es el de C·(-1)^k
+			return AsymptoticTest(point, end, leading, q, "diverge", _sign_infinity(coeff * (-1) ** k))
+	except Exception:
+		pass
+
+	# Comparación en el límite con la integral p frontera, q = 1
+	h = g / u if at_infinity else g * u
+	try:
+		# Si h ya es despreciable cerca del extremo el límite no decide nada y se omite
+		if all(abs(complex(h.subs(u, sp.Float(v)).evalf())) < 1e-12 for v in (1e-4, 1e-8)):
+			return None
+	except Exception:
+		pass
+	try:
+		L = limit(h, u, 0, '+')
+	except Exception:
+		return None
+	if L in (oo, -oo):
+		return AsymptoticTest(point, end, f, None, "diverge", L)
+	if L.is_number and L.is_real and L != 0 and L.is_finite:
+		return AsymptoticTest(point, end, L * back if at_infinity else L / back, None, "diverge", _sign_infinity(L))
+	return None
+
+
+def _asymptotic_precheck(result, x):
+	"""
+	Prueba asintótica en cada extremo impropio del modo. Devuelve el valor
+	divergente (oo, -oo o zoo) del primero que diverge, o None. Cada prueba
+	queda en result.asymptotic.
+	"""
+	for lo, hi, end in _improper_parts(result):
+		point = hi if end == "upper" else lo
+		try:
+			with _time_limit(ASYMPTOTIC_TIMEOUT):
+				test = asymptotic_test(result.f, x, point, end)
+		except TimeoutError:
+			test = None
+		if test is None:
+			continue
+		result.asymptotic.append(test)
+		if test.verdict == "diverge":
+			return test.value
+	return None
+
+
+def _evaluate_numerically(result, x, f=None):
+	"""
+	Respaldo numérico cuando no hay antiderivada simbólica (de result.f, o
+	de `f` si se da). Antes de integrar se comprueba numéricamente cada
+	extremo impropio: si alguno diverge se devuelve oo, -oo o nan en lugar
+	de un número finito engañoso, y si la prueba no es concluyente solo se
+	acepta un valor con error pequeño.
+	"""
+	a, b, c, mode = result.a, result.b, result.c, result.mode
+	f = result.f if f is None else f
+
+	conclusive = True
+	for lo, hi, end in _improper_parts(result):
+		test = improper_test(f, x, lo, hi, end)
+		if test.verdict == "diverge":
+			_count(result, "numeric_divergence")
+			return test.value
+		conclusive = conclusive and test.verdict == "converge"
+	if not conclusive:
+		_count(result, "numeric_inconclusive")
+	require_accuracy = not conclusive
+
+	if mode in ("proper", "infinite_upper", "infinite_lower", "infinite_both"):
+		return _numeric_value(f, a, b, x, require_accuracy)
+	if mode == "singular_lower":
+		return _numeric_near_singularity(f, float(a), float(b), x, "lower", require_accuracy)
+	if mode == "singular_upper":
+		return _numeric_near_singularity(f, float(a), float(b), x, "upper", require_accuracy)
+	if mode == "internal_singular":
+		c_val = c if c is not None else sp.Integer(0)
+		num1 = _numeric_value(f, float(a), float(c_val), x, require_accuracy)
+		num2 = _numeric_value(f, float(c_val), float(b), x, require_accuracy)
+		if num1 is not None and num2 is not None:
+			return num1 + num2
+	return None
@@ -0,0 +1,269 @@
+"""
+Barrido paramétrico: convergencia y valor de ∫_a^b f(x, p) dx en una malla
+de valores de p.
+
+Para preguntas como «¿para qué p converge ∫_1^oo 1/x**p?» no hace falta
+resolver cada valor por separado: la antiderivada se calcula una sola vez
+con p simbólico (SymPy devuelve un Piecewise cuando depende de p) y los
+límites en los dos extremos se estiman para toda la malla con una sola
+evaluación vectorizada (extrapolation.numeric_limit_grid). Las posibles
+singularidades interiores también se hallan una sola vez con p simbólico y
+se sitúan en toda la malla numéricamente. Solo los valores en que eso no
+decide (límite no concluyente, ∞ - ∞, una singularidad interior o f sin
+antiderivada) se resuelven uno a uno por la vía numérica.
+"""
+import math
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+import sympy as sp
+from sympy import oo, Symbol
+
+from compiled import compiled
+from extrapolation import numeric_limit_grid
+from solver import (
+	InvalidInputError, asymptotic_test, find_singularities, parse_integral, safe_float,
+	singularity_equations, solve_parsed, termwise_antiderivative,
+)
+
+# Valores de la malla como máximo
+SWEEP_MAX_POINTS = 201
+# Plazo (s) de un barrido completo en un proceso trabajador
+SWEEP_TIMEOUT = 60
+
+
+@dataclass
+class SweepPoint:
+	"""
+	Una fila del barrido. `verdict` es "converge", "diverge" o None; `value`
+	es un float (±inf o nan si diverge, None si no se calculó). `method` es
+	"antiderivative" (antiderivada común + límites), "asymptotic" (prueba
+	asintótica, ver solver.asymptotic_test) o "numeric".
+	"""
+	param: float
+	verdict: str
+	value: float
+	method: str
+
+
+@dataclass
+class SweepResult:
+	"""Resultado de sweep_parsed; `status` es "ok", "invalid_input" o "error"."""
+	f: object = None
+	a: object = None
+	b: object = None
+	var: str = 'x'
+	param: str = 'p'
+	F: object = None
+	F_status: str = None
+	points: list = field(default_factory=list)
+	status: str = "ok"
+	message: str = ""
+	timings: dict = field(default_factory=dict)
+
+	def counts(self):
+		"""Número de filas por método, p. ej. {"antiderivative": 40, "numeric": 1}."""
+		counts = {}
+		for point in self.points:
+			counts[point.method] = counts.get(point.method, 0) + 1
+		return counts
+
+
+def parse_sweep(f_str, a_str, b_str, param, var='x'):
+	"""Como parse_integral, comprobando que f solo dependa de x y del parámetro y que a y b no dependan de él."""
+	if not param.isidentifier() or param == var:
+		raise InvalidInputError("param", f"El parámetro debe ser un nombre de variable distinto de {var}, como p o k.")
+	f, a, b = parse_integral(f_str, a_str, b_str)
+	extra = f.free_symbols - {Symbol(var), Symbol(param)}
+	if extra:
+		raise InvalidInputError("f", f"f(x) solo puede depender de {var} y de {param}; sobra: {', '.join(sorted(map(str, extra)))}.")
+	if Symbol(param) not in f.free_symbols:
+		raise InvalidInputError("f", f"f(x) no depende del parámetro {param}.")
+	for name, bound in (("a", a), ("b", b)):
+		if bound.free_symbols:
+			raise InvalidInputError(name, f"El límite {name} debe ser un número, oo o -oo.")
+	return f, a, b
+
+
+def _as_float(value):
+	if value == oo:
+		return math.inf
+	if value == -oo:
+		return -math.inf
+	number = safe_float(value)
+	return math.nan if number is None else number
+
+
+def _combine(upper, lower):
+	"""
+	(veredicto, valor) de F(b⁻) - F(a⁺) a partir de los dos límites
+	estimados, o None si no se puede decidir (no concluyente o ∞ - ∞).
+	"""
+	if upper.verdict is None or lower.verdict is None:
+		return None
+	if upper.verdict == lower.verdict == "converge":
+		return "converge", upper.value - lower.value
+	# Aporte de cada extremo que diverge: +F(b) y -F(a)
+	parts = []
+	if upper.verdict == "diverge":
+		parts.append(_as_float(upper.value))
+	if lower.verdict == "diverge":
+		parts.append(-_as_float(lower.value))
+	if len(parts) == 1:
+		return "diverge", parts[0]
+	if math.isinf(parts[0]) and parts[0] == parts[1]:
+		return "diverge", parts[0]
+	return None
+
+
+def _has_interior_singularity(f, a, b, x):
+	try:
+		return any(
+			(a == -oo or float(s) > float(a)) and (b == oo or float(s) < float(b))
+			for s in find_singularities(f, a, b, x)
+		)
+	except Exception:
+		return True
+
+
+def _finite_solutions(sols):
+	"""Elementos de una solución de solveset que sea finita (quizá cortada con los reales), o None."""
+	if sols is sp.S.EmptySet:
+		return []
+	if isinstance(sols, sp.FiniteSet):
+		return list(sols)
+	if isinstance(sols, sp.Union):
+		parts = [_finite_solutions(arg) for arg in sols.args]
+		return None if any(part is None for part in parts) else [s for part in parts for s in part]
+	if isinstance(sols, sp.Intersection):
+		# Intersection({p}, Reals): que la solución sea real se comprueba en la malla
+		finite = [arg for arg in sols.args if isinstance(arg, sp.FiniteSet)]
+		if len(finite) == 1 and all(arg is finite[0] or arg.is_superset(sp.S.Reals) for arg in sols.args):
+			return list(finite[0])
+	return None
+
+
+def _parametric_singularities(f, x, p):
+	"""
+	Posibles singularidades de f con p simbólico, como pares (x_s(p),
+	exponente o None; ver solver.singularity_equations). None si alguna
+	ecuación no tiene un conjunto finito de soluciones (p. ej. polos
+	periódicos de tan(p*x)).
+	"""
+	candidates = []
+	for expr, exponent in singularity_equations(f, x):
+		try:
+			solutions = _finite_solutions(sp.solveset(sp.Eq(expr, 0), x, domain=sp.S.Reals))
+		except Exception:
+			return None
+		if solutions is None:
+			return None
+		candidates.extend((s, exponent) for s in solutions)
+	return candidates
+
+
+def _on_grid(expr, p, grid):
+	"""expr(p) en cada valor de la malla, en complejos (nan donde no se puede evaluar)."""
+	with np.errstate(all='ignore'):
+		values = compiled(sp.sympify(expr), p, 'numpy')(grid.astype(complex))
+	return np.broadcast_to(np.asarray(values, dtype=complex), grid.shape)
+
+
+def _interior_singular_mask(candidates, a, b, p, grid):
+	"""Por cada valor de la malla, True si alguna singularidad candidata es real y cae dentro de (a, b)."""
+	mask = np.zeros(grid.shape, dtype=bool)
+	for s, exponent in candidates:
+		xs = _on_grid(s, p, grid)
+		hit = np.isfinite(xs) & (np.abs(xs.imag) <= 1e-9 * (1 + np.abs(xs.real)))
+		if a != -oo:
+			hit &= xs.real > float(a)
+		if b != oo:
+			hit &= xs.real < float(b)
+		if exponent is not None:
+			hit &= _on_grid(exponent, p, grid).real < 0
+		mask |= hit
+	return mask
+
+
+def _numeric_point(f, a, b, x, value):
+	"""
+	Un valor del parámetro resuelto por separado. Antes de integrar se
+	aplica la prueba asintótica en los dos extremos: si alguno diverge no
+	hace falta más, y si los dos convergen el veredicto queda decidido aunque
+	la integración numérica no alcance la precisión pedida.
+	"""
+	tests = []
+	for point, end in ((a, "lower"), (b, "upper")):
+		try:
+			tests.append(asymptotic_test(f, x, point, end))
+		except Exception:
+			tests.append(None)
+	for test in tests:
+		if test is not None and test.verdict == "diverge":
+			return SweepPoint(value, "diverge", _as_float(test.value), "asymptotic")
+	numeric = solve_parsed(f, a, b, str(x), symbolic=False)
+	number = None if numeric.value is None else _as_float(numeric.value)
+	if numeric.verdict is None and all(test is not None and test.verdict == "converge" for test in tests):
+		return SweepPoint(value, "converge", None, "asymptotic")
+	return SweepPoint(value, numeric.verdict, number, "numeric")
+
+
+def sweep_parsed(f, a, b, param, values, var='x'):
+	"""
+	Convergencia y valor de la integral para cada valor de `param` en
+	`values` (ya parseados). Nunca lanza excepciones; los errores quedan en
+	el SweepResult.
+	"""
+	x, p = Symbol(var), Symbol(param)
+	result = SweepResult(f=f, a=a, b=b, var=var, param=param)
+	try:
+		grid = np.unique(np.asarray([float(v) for v in values], dtype=float))
+		if grid.size == 0 or grid.size > SWEEP_MAX_POINTS or not np.all(np.isfinite(grid)):
+			raise InvalidInputError("values", f"La malla debe tener entre 1 y {SWEEP_MAX_POINTS} valores finitos.")
+		if a == b:
+			result.points = [SweepPoint(float(v), "converge", 0.0, "antiderivative") for v in grid]
+			return result
+
+		start = time.perf_counter()
+		F, _, result.F_status = termwise_antiderivative(f, x)
+		result.F = F if result.F_status == "ok" else None
+		result.timings["antiderivative"] = time.perf_counter() - start
+
+		start = time.perf_counter()
+		if result.F is not None:
+			# Límites laterales desde dentro del intervalo: en un extremo regular valen F(a) y F(b)
+			lower = numeric_limit_grid(result.F, x, p, grid, a, None if a == -oo else '+')
+			upper = numeric_limit_grid(result.F, x, p, grid, b, None if b == oo else '-')
+			decided = [_combine(up, lo) for up, lo in zip(upper, lower)]
+		else:
+			decided = [None] * grid.size
+		result.timings["limits"] = time.perf_counter() - start
+
+		start = time.perf_counter()
+		singular = None
+		if any(outcome is not None for outcome in decided):
+			# Una sola búsqueda simbólica para toda la malla; si no es posible se busca valor a valor
+			candidates = _parametric_singularities(f, x, p)
+			try:
+				singular = None if candidates is None else _interior_singular_mask(candidates, a, b, p, grid)
+			except Exception:
+				singular = None
+		result.timings["singularities"] = time.perf_counter() - start
+
+		start = time.perf_counter()
+		for index, (value, outcome) in enumerate(zip(grid, decided)):
+			f_value = f.subs(p, sp.Float(value))
+			if outcome is not None and not (
+				singular[index] if singular is not None else _has_interior_singularity(f_value, a, b, x)
+			):
+				verdict, number = outcome
+				result.points.append(SweepPoint(float(value), verdict, float(number), "antiderivative"))
+				continue
+			result.points.append(_numeric_point(f_value, a, b, x, float(value)))
+		result.timings["numeric"] = time.perf_counter() - start
+	except InvalidInputError as e:
+		result.status, result.message = "invalid_input", str(e)
+	except Exception as e:
+		result.status, result.message = "error", f"{type(e).__name__}: {e}"
+	return result
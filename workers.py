@@ -0,0 +1,315 @@
+"""
+Procesos trabajadores con plazos reales para los cálculos de SymPy.
+
+`signal.SIGALRM` solo funciona en el hilo principal y Streamlit ejecuta cada
+script en un hilo aparte, así que un `sp.integrate` desbocado bloqueaba un
+hilo del servidor para siempre. Aquí cada tarea corre en un proceso hijo;
+si supera su plazo, el proceso se mata y se reemplaza por uno nuevo.
+
+Cada tarea tiene además un presupuesto de memoria: antes de empezarla, el
+trabajador limita su espacio de direcciones (RLIMIT_AS) a lo que ya usa más
+TASK_MEMORY_BUDGET_MB, así que una expresión que crece sin control acaba en
+MemoryError dentro del trabajador en lugar de despertar al OOM killer. Tras
+WORKER_MAX_TASKS tareas, o tras una cuyo pico de memoria residente supere
+WORKER_MEMORY_HIGH_WATER_MB, el trabajador se reemplaza por uno nuevo para
+devolver al sistema la memoria que SymPy y sus cachés no liberan.
+"""
+import atexit
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+import types
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+
+from metrics import metrics
+
+try:
+	import resource
+except ImportError:  # Windows: sin límite de memoria por tarea
+	resource = None
+
+POOL_SIZE = max(2, min(4, os.cpu_count() or 1))
+# Cada cuánto (s) se comprueba si una tarea en curso fue cancelada
+CANCEL_CHECK_SECONDS = 0.1
+# Memoria (MB) que cada tarea puede reservar además de la que ya usa el trabajador; 0 desactiva el límite
+TASK_MEMORY_BUDGET_MB = int(os.environ.get("INTEGRALES_TASK_MEMORY_MB", "1024"))
+# Un trabajador se reemplaza tras este número de tareas...
+WORKER_MAX_TASKS = 200
+# ... o tras una tarea cuyo pico de memoria residente supere este umbral (MB)
+WORKER_MEMORY_HIGH_WATER_MB = 512
+
+# Primer elemento de los mensajes de avance que el trabajador envía antes de la respuesta
+_PROGRESS = "progress"
+
+
+class WorkerCrashedError(RuntimeError):
+	"""El proceso trabajador terminó de forma inesperada durante una tarea."""
+
+
+def _memory_status():
+	"""
+	(memoria virtual, residente y pico residente) del proceso en KiB. Fuera
+	de Linux solo se conoce el pico de toda la vida del proceso, y en
+	Windows nada: lo que no se puede medir es None.
+	"""
+	try:
+		with open("/proc/self/status") as status:
+			fields = dict(line.split(":", 1) for line in status if ":" in line)
+		return tuple(int(fields[name].split()[0]) for name in ("VmSize", "VmRSS", "VmHWM"))
+	except (OSError, KeyError, ValueError):
+		pass
+	if resource is None:
+		return None, None, None
+	peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	# ru_maxrss está en bytes en macOS y en KiB en el resto
+	return None, None, peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _reset_memory_peak():
+	# Solo en Linux: reinicia VmHWM para medir el pico de cada tarea por separado
+	try:
+		with open("/proc/self/clear_refs", "w") as refs:
+			refs.write("5")
+	except OSError:
+		pass
+
+
+def _limit_task_memory(budget_mb):
+	"""
+	Limita el espacio de direcciones del proceso (RLIMIT_AS) a lo que ya usa
+	más `budget_mb`; con budget_mb=None (o 0) se quita el límite.
+	"""
+	if resource is None:
+		return
+	try:
+		_, hard = resource.getrlimit(resource.RLIMIT_AS)
+		limit = hard
+		if budget_mb:
+			size, _, _ = _memory_status()
+			if size is None:
+				return
+			limit = (size + budget_mb * 1024) * 1024
+			if hard != resource.RLIM_INFINITY:
+				limit = min(limit, hard)
+		resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+	except (ValueError, OSError):
+		pass
+
+
+def _worker_main(conn, memory_budget_mb):
+	# Se importa SymPy antes de aceptar tareas para que su coste no cuente en el plazo
+	import sympy  # noqa: F401
+	conn.send("ready")
+	while True:
+		try:
+			task = conn.recv()
+		except (EOFError, OSError):
+			break
+		if task is None:
+			break
+		fn, args, kwargs, wants_progress = task
+		if wants_progress:
+			kwargs = dict(kwargs, on_progress=lambda *payload: conn.send((_PROGRESS, payload)))
+		# Después de recibir la tarea, para que los módulos que importa no cuenten en el presupuesto
+		_limit_task_memory(memory_budget_mb)
+		_reset_memory_peak()
+		try:
+			reply = (True, fn(*args, **kwargs))
+		except BaseException as e:
+			# Sin el traceback, que retendría lo que la tarea llegó a reservar (no viaja con pickle)
+			reply = (False, e.with_traceback(None))
+		# La respuesta se envía sin límite: tras un MemoryError no debe fallar también el envío
+		_limit_task_memory(None)
+		_, rss, peak = _memory_status()
+		memory = {"rss_kib": rss, "peak_kib": peak}
+		try:
+			conn.send(reply + (memory,))
+		except Exception as e:
+			# El resultado o la excepción no se pudo serializar
+			conn.send((False, RuntimeError(f"{type(e).__name__}: {e}"), memory))
+
+
+_start_lock = threading.Lock()
+
+
+def _start_process(process):
+	# Streamlit registra el script como __main__; con "spawn" cada hijo lo
+	# volvería a ejecutar entero, así que se oculta mientras arranca el proceso.
+	with _start_lock:
+		main_module = sys.modules.get("__main__")
+		sys.modules["__main__"] = types.ModuleType("__main__")
+		try:
+			process.start()
+		finally:
+			sys.modules["__main__"] = main_module
+
+
+class _Worker:
+	def __init__(self, ctx, memory_budget_mb=TASK_MEMORY_BUDGET_MB):
+		self.conn, child_conn = ctx.Pipe()
+		self.process = ctx.Process(target=_worker_main, args=(child_conn, memory_budget_mb), daemon=True)
+		_start_process(self.process)
+		child_conn.close()
+		self.ready = False
+		self.tasks = 0
+
+	def wait_ready(self):
+		if not self.ready:
+			if self.conn.recv() != "ready":
+				raise WorkerCrashedError("El proceso trabajador no arrancó correctamente")
+			self.ready = True
+
+	def kill(self):
+		try:
+			self.process.kill()
+			self.process.join(5)
+		except Exception:
+			pass
+		try:
+			self.conn.close()
+		except Exception:
+			pass
+
+	def close(self):
+		try:
+			self.conn.send(None)
+		except Exception:
+			pass
+		self.process.join(1)
+		if self.process.is_alive():
+			self.kill()
+
+
+class SolverPool:
+	"""
+	Conjunto fijo de procesos trabajadores. `run` bloquea hasta obtener el
+	resultado o lanza TimeoutError si la tarea supera `timeout` segundos;
+	`submit` hace lo mismo en segundo plano y devuelve un Future.
+
+	Con `on_progress`, la función recibe un argumento `on_progress` y cada
+	llamada que haga desde el trabajador se reenvía a `on_progress(*args)`
+	en este proceso (desde el hilo que espera la tarea). Si se activa
+	`cancel_event` (un threading.Event), el trabajador se mata, se reemplaza
+	y se lanza concurrent.futures.CancelledError. Con `on_memory`, al
+	terminar la tarea se llama a `on_memory(pico)` con el pico de memoria
+	residente del trabajador durante la tarea, en KiB.
+	"""
+
+	def __init__(self, size=POOL_SIZE, memory_budget_mb=TASK_MEMORY_BUDGET_MB,
+			max_tasks=WORKER_MAX_TASKS, memory_high_water_mb=WORKER_MEMORY_HIGH_WATER_MB):
+		self.size = size
+		self.memory_budget_mb = memory_budget_mb
+		self.max_tasks = max_tasks
+		self.memory_high_water_mb = memory_high_water_mb
+		self._ctx = multiprocessing.get_context("spawn")
+		self._idle = queue.Queue()
+		for _ in range(size):
+			self._idle.put(self._new_worker())
+		self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="solver-pool")
+		self._closed = False
+
+	def _new_worker(self):
+		return _Worker(self._ctx, self.memory_budget_mb)
+
+	def _recycle_reason(self, worker, memory):
+		if worker.tasks >= self.max_tasks:
+			return "tasks"
+		peak = memory["peak_kib"]
+		if peak is not None and peak > self.memory_high_water_mb * 1024:
+			return "memory"
+		return None
+
+	def run(self, fn, *args, timeout=None, on_progress=None, cancel_event=None, on_memory=None, **kwargs):
+		if cancel_event is not None and cancel_event.is_set():
+			raise CancelledError()
+		worker = self._idle.get()
+		if cancel_event is not None and cancel_event.is_set():
+			# Cancelada mientras esperaba un proceso libre: no hace falta matarlo
+			self._idle.put(worker)
+			raise CancelledError()
+		timed_out = cancelled = False
+		try:
+			worker.wait_ready()
+			worker.conn.send((fn, args, kwargs, on_progress is not None))
+			deadline = None if timeout is None else time.monotonic() + timeout
+			while True:
+				remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+				if cancel_event is not None:
+					remaining = CANCEL_CHECK_SECONDS if remaining is None else min(remaining, CANCEL_CHECK_SECONDS)
+				if not worker.conn.poll(remaining):
+					cancelled = cancel_event is not None and cancel_event.is_set()
+					timed_out = deadline is not None and time.monotonic() >= deadline
+					if not (cancelled or timed_out):
+						continue
+					worker.kill()
+					worker = self._new_worker()
+					break
+				message = worker.conn.recv()
+				if message[0] == _PROGRESS:
+					on_progress(*message[1])
+					continue
+				ok, value, memory = message
+				worker.tasks += 1
+				reason = self._recycle_reason(worker, memory)
+				if reason is not None:
+					# Ya respondió: se reemplaza sin esperar a que termine solo
+					metrics.count(f"workers.recycled_{reason}")
+					worker.kill()
+					worker = self._new_worker()
+				if on_memory is not None and memory["peak_kib"] is not None:
+					on_memory(memory["peak_kib"])
+				break
+		except (EOFError, OSError, WorkerCrashedError) as e:
+			worker.kill()
+			worker = self._new_worker()
+			raise WorkerCrashedError(f"El proceso trabajador terminó inesperadamente: {e}")
+		finally:
+			self._idle.put(worker)
+		if cancelled:
+			raise CancelledError()
+		if timed_out:
+			raise TimeoutError(f"La tarea superó el plazo de {timeout} s")
+		if ok:
+			return value
+		raise value
+
+	def submit(self, fn, *args, timeout=None, on_progress=None, cancel_event=None, on_memory=None, **kwargs):
+		return self._executor.submit(
+			self.run, fn, *args, timeout=timeout, on_progress=on_progress, cancel_event=cancel_event, on_memory=on_memory, **kwargs,
+		)
+
+	def shutdown(self):
+		if self._closed:
+			return
+		self._closed = True
+		self._executor.shutdown(wait=False, cancel_futures=True)
+		while True:
+			try:
+				self._idle.get_nowait().close()
+			except queue.Empty:
+				break
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+	"""Devuelve el pool compartido del proceso (se crea en el primer uso)."""
+	global _pool
+	with _pool_lock:
+		if _pool is None:
+			_pool = SolverPool()
+			atexit.register(_pool.shutdown)
+		return _pool
+
+
+def run_with_deadline(fn, *args, timeout, **kwargs):
+	"""
+	Ejecuta fn(*args, **kwargs) en un proceso trabajador con un plazo real.
+	Si el proceso no supera el plazo se mata, se reemplaza y se lanza TimeoutError.
+	"""
+	return get_pool().run(fn, *args, timeout=timeout, **kwargs)